@@ -0,0 +1,79 @@
+"""A single entry point for running solvers:
+
+    python -m advent run 20 --part 2 --timing
+
+Only the requested day's module is imported, and its `if __name__ == "__main__"` block (which
+runs both parts, and in day_20's case its tests too) is skipped. Answers are cached on disk until
+the solver, anything it imports or its input changes; pass --no-cache to recompute them anyway.
+"""
+
+import time
+
+# Taken before anything else is imported, so that we can tell how long the interpreter took to
+# start up. Startup is CPU-bound, so the CPU time this process has used so far is a good measure.
+STARTUP_CPU_SECONDS = time.process_time()
+MODULE_START = time.perf_counter()
+
+import argparse
+import importlib
+import os
+import sys
+
+from disk_cache import DISABLE_ANSWER_CACHE_ENV_VAR, cached_answer
+
+
+def run(day: int, parts: list[int], timing: bool) -> None:
+    import_start = time.perf_counter()
+    module = importlib.import_module(f"day_{day}")
+    import_seconds = time.perf_counter() - import_start
+
+    # Days with a SolveContext can share work between their parts.
+    part_args = [module.SolveContext()] if hasattr(module, "SolveContext") else []
+
+    execution_seconds = 0.0
+    for part in parts:
+        part_start = time.perf_counter()
+        part_name = f"part_{part}"
+        answer = cached_answer(
+            module, part_name, lambda: getattr(module, part_name)(*part_args)
+        )
+        execution_seconds += time.perf_counter() - part_start
+        print(answer)
+
+    if timing:
+        print(
+            f"startup {STARTUP_CPU_SECONDS:.4f}s (cpu) "
+            f"import {import_seconds:.4f}s "
+            f"execution {execution_seconds:.4f}s "
+            f"total {time.perf_counter() - MODULE_START + STARTUP_CPU_SECONDS:.4f}s",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m advent")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Print a day's answers.")
+    run_parser.add_argument("day", type=int)
+    run_parser.add_argument(
+        "--part", type=int, choices=[1, 2], help="Only run this part."
+    )
+    run_parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Report startup, import and execution times to stderr.",
+    )
+    run_parser.add_argument(
+        "--no-cache", action="store_true", help="Don't use cached answers."
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        if args.no_cache:
+            os.environ[DISABLE_ANSWER_CACHE_ENV_VAR] = "1"
+        run(args.day, [args.part] if args.part else [1, 2], args.timing)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""How many people in each day 6 group answered "yes" to each question.
+
+The counts are kept in a (groups x 26) matrix, so "anyone", "everyone" and anything in between,
+like "at least half of the group", are all one vectorized comparison against it, without looking
+at the answers again. The matrix is built a chunk of groups at a time, so it can be built from
+util.load_line_groups_from_file's output or from a stream of groups from
+util.iter_line_groups_from_file:
+
+    python answer_counts.py --at-least-fraction 0.5
+"""
+
+import argparse
+import itertools
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Iterable
+
+import numpy as np
+
+from util import iter_line_groups_from_file
+
+
+@dataclass
+class AnswerCounts:
+    # counts[g, q] is how many people in group g answered "yes" to question q, where a is
+    # question 0 and z is question 25.
+    counts: np.ndarray
+    group_sizes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.group_sizes)
+
+    def answered_by_at_least(self, num_people: int | np.ndarray) -> np.ndarray:
+        """Returns a (groups x 26) array of whether at least `num_people` people in each group
+        answered "yes" to each question. `num_people` can also be one number per group.
+        """
+        return self.counts >= np.reshape(num_people, (-1, 1))
+
+    def answered_by_at_least_fraction(self, fraction: float | Fraction) -> np.ndarray:
+        # Rounded up in integers, since in floating point 100 * 0.07 is 7.000000000000001, which
+        # would round up to 8.
+        fraction = Fraction(fraction).limit_denominator(2**20)
+        return self.answered_by_at_least(
+            -(
+                -self.group_sizes.astype(np.int64)
+                * fraction.numerator
+                // fraction.denominator
+            )
+        )
+
+    def answered_by_anyone(self) -> np.ndarray:
+        return self.answered_by_at_least(1)
+
+    def answered_by_everyone(self) -> np.ndarray:
+        return self.answered_by_at_least(self.group_sizes)
+
+
+def count_chunk(groups: list[list[str]] | list[list[bytes]]) -> AnswerCounts:
+    lines = [line for group in groups for line in group]
+    group_sizes = np.fromiter(map(len, groups), dtype=np.uint32, count=len(groups))
+    if not len(group_sizes) or not group_sizes.min():
+        raise ValueError("every group needs at least one person in it")
+
+    if lines and isinstance(lines[0], str):
+        data = "".join(lines).encode()
+    else:
+        data = b"".join(lines)
+    questions = np.frombuffer(data, dtype=np.uint8).astype(np.intp) - ord("a")
+    if len(questions) and not 0 <= questions.min() <= questions.max() < 26:
+        raise ValueError("answers can only be the letters a through z")
+
+    # Mark which questions each person answered, so that answering the same question twice
+    # still only counts once, and then add up each group's people.
+    line_lengths = np.fromiter(map(len, lines), dtype=np.intp, count=len(lines))
+    answered = np.zeros((len(lines), 26), dtype=np.uint8)
+    answered[np.repeat(np.arange(len(lines)), line_lengths), questions] = 1
+
+    group_starts = np.cumsum(group_sizes, dtype=np.intp) - group_sizes
+    counts = np.add.reduceat(answered, group_starts, axis=0, dtype=np.uint32)
+
+    return AnswerCounts(
+        counts=counts.astype(np.min_scalar_type(group_sizes.max())),
+        group_sizes=group_sizes,
+    )
+
+
+def build_answer_counts(
+    groups: Iterable[list[str]] | Iterable[list[bytes]], chunk_size: int = 2**16
+) -> AnswerCounts:
+    """Builds the count matrix for `groups`, `chunk_size` groups at a time, so that only one
+    chunk's worth of answers is in memory at once on top of the matrix itself."""
+    groups = iter(groups)
+    chunks = []
+    while chunk := list(itertools.islice(groups, chunk_size)):
+        chunks.append(count_chunk(chunk))
+
+    if not chunks:
+        return AnswerCounts(
+            counts=np.zeros((0, 26), dtype=np.uint8),
+            group_sizes=np.zeros(0, dtype=np.uint32),
+        )
+
+    return AnswerCounts(
+        counts=np.concatenate([chunk.counts for chunk in chunks]),
+        group_sizes=np.concatenate([chunk.group_sizes for chunk in chunks]),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--at-least-fraction", type=float, default=0.5)
+    args = parser.parse_args()
+
+    answer_counts = build_answer_counts(
+        iter_line_groups_from_file("inputs/day_6.txt", as_bytes=True)
+    )
+    print(np.count_nonzero(answer_counts.answered_by_anyone()))
+    print(np.count_nonzero(answer_counts.answered_by_everyone()))
+    print(
+        np.count_nonzero(
+            answer_counts.answered_by_at_least_fraction(args.at_least_fraction)
+        )
+    )
@@ -0,0 +1,187 @@
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+from disk_cache import DISABLE_INPUT_CACHE_ENV_VAR, INPUT_CACHE
+
+REPO_DIRECTORY = Path(__file__).parent
+PART_NAMES = ("part_1", "part_2")
+
+
+def discover_days() -> list[int]:
+    return sorted(
+        int(path.stem.split("_")[1]) for path in REPO_DIRECTORY.glob("day_*.py")
+    )
+
+
+def import_day(day: int) -> ModuleType:
+    if str(REPO_DIRECTORY) not in sys.path:
+        sys.path.insert(0, str(REPO_DIRECTORY))
+
+    return importlib.import_module(f"day_{day}")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile, so that e.g. the p95 of 5 samples is their max."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "min": min(values),
+        "median": statistics.median(values),
+        "p95": percentile(values, 0.95),
+    }
+
+
+def time_part(part_fn: Callable[[], object], warmup: int, repeats: int) -> dict:
+    for _ in range(warmup):
+        part_fn()
+
+    wall_times = []
+    cpu_times = []
+    for _ in range(repeats):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        answer = part_fn()
+        cpu_times.append(time.process_time() - cpu_start)
+        wall_times.append(time.perf_counter() - wall_start)
+
+    return {
+        "answer": str(answer),
+        "repeats": repeats,
+        "wall": summarize(wall_times),
+        "cpu": summarize(cpu_times),
+    }
+
+
+def find_regressions(
+    results: dict[str, dict], baseline: dict[str, dict], threshold: float
+) -> list[tuple[str, float, float]]:
+    """Returns (part name, baseline median, new median) for each part whose median wall time is
+    more than `threshold` (e.g. 0.1 for 10%) slower than it was in `baseline`."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        old_median = baseline[name]["wall"]["median"]
+        new_median = result["wall"]["median"]
+        if new_median > old_median * (1 + threshold):
+            regressions.append((name, old_median, new_median))
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Times every day's part_1 and part_2 and writes the results to a JSON file."
+    )
+    parser.add_argument("--days", type=int, nargs="*", help="Only run these days.")
+    parser.add_argument(
+        "--skip",
+        nargs="*",
+        default=[],
+        help="Parts to skip, like day_15.part_2.",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=str(REPO_DIRECTORY / "bench_output.txt"))
+    parser.add_argument("--baseline", help="A previous output file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Flag parts whose median is more than this fraction slower than the baseline.",
+    )
+    parser.add_argument(
+        "--no-input-cache",
+        action="store_true",
+        help="Parse inputs from scratch on every call instead of using the parsed-input cache.",
+    )
+    args = parser.parse_args()
+
+    if args.no_input_cache:
+        os.environ[DISABLE_INPUT_CACHE_ENV_VAR] = "1"
+
+    results = {}
+    for day in args.days or discover_days():
+        module = import_day(day)
+        for part_name in PART_NAMES:
+            name = f"day_{day}.{part_name}"
+            if name in args.skip or not hasattr(module, part_name):
+                continue
+
+            result = time_part(getattr(module, part_name), args.warmup, args.repeats)
+            results[name] = result
+            print(
+                f"{name:<16} min {result['wall']['min']:9.4f}s "
+                f"median {result['wall']['median']:9.4f}s "
+                f"p95 {result['wall']['p95']:9.4f}s "
+                f"cpu {result['cpu']['median']:9.4f}s",
+                flush=True,
+            )
+
+    # These only count this run's calls, which is why they're reported here rather than by
+    # `disk_cache.py stats`.
+    input_cache_stats = {
+        name: INPUT_CACHE.stats[name]
+        for name in ("hits", "misses", "evictions", "too_large")
+    }
+    print(
+        "input cache: "
+        + ", ".join(f"{count} {name}" for name, count in input_cache_stats.items())
+    )
+
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.time(),
+                "input_cache": input_cache_stats,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, old_median, new_median in regressions:
+        print(
+            f"REGRESSION {name}: median {old_median:.4f}s -> {new_median:.4f}s "
+            f"({new_median / old_median - 1:+.0%})"
+        )
+
+    # A speedup that changes the answer isn't a speedup.
+    changed_answers = [
+        name
+        for name, result in results.items()
+        if name in baseline and result["answer"] != baseline[name]["answer"]
+    ]
+    for name in changed_answers:
+        print(
+            f"ANSWER CHANGED {name}: {baseline[name]['answer']} -> {results[name]['answer']}"
+        )
+
+    return 1 if regressions or changed_answers else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""A long-running server that keeps solver modules imported and their work cached in memory.
+
+Every `python day_N.py` run pays for interpreter startup, imports and parsing before it can do
+anything useful; the daemon pays for them once. Requests and responses are JSON objects, one per
+line, over a Unix domain socket:
+
+    python daemon.py serve &
+    python daemon.py query 7 2 --arg color="dim purple"
+    python daemon.py bench 7 2 --requests 1000
+
+Any fields of a request besides "day", "part" and "memoize" are passed to the part function as
+keyword arguments, e.g. {"day": 7, "part": 2, "color": "dim purple"}. For days with a SolveContext,
+one context per day is kept for the lifetime of the daemon, and answers are remembered unless the
+request has "memoize": false. Both are dropped when a day's input file changes, and a
+{"command": "reset"} request drops everything.
+
+`bench` times warm solves, with memoization off, unless it's given --memoized.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from types import ModuleType
+
+from bench import import_day, summarize
+from disk_cache import CACHE_DIRECTORY, file_digest, input_filename_for
+
+DEFAULT_SOCKET_PATH = os.path.join(CACHE_DIRECTORY, "daemon.sock")
+
+
+class Solvers:
+    def __init__(self):
+        self.modules: dict[int, ModuleType] = {}
+        self.contexts: dict[int, object] = {}
+        self.answers: dict[tuple, object] = {}
+        self.input_digests: dict[int, str | None] = {}
+        # (size, mtime) of each day's input when it was last hashed, so that it's only hashed
+        # again when one of those changes.
+        self.input_stats: dict[int, tuple[int, int] | None] = {}
+
+    def module(self, day: int) -> ModuleType:
+        if day not in self.modules:
+            self.modules[day] = import_day(day)
+        module = self.modules[day]
+
+        # Anything kept from an older version of the day's input is stale.
+        input_filename = input_filename_for(module)
+        try:
+            input_stat = os.stat(input_filename)
+        except FileNotFoundError:
+            input_stats = None
+        else:
+            input_stats = (input_stat.st_size, input_stat.st_mtime_ns)
+
+        if day in self.input_stats and self.input_stats[day] == input_stats:
+            return module
+        self.input_stats[day] = input_stats
+
+        # The input's been touched, but it only matters if its contents actually changed.
+        digest = None if input_stats is None else file_digest(input_filename)
+        if self.input_digests.get(day, digest) != digest:
+            self.contexts.pop(day, None)
+            self.answers = {
+                key: answer for key, answer in self.answers.items() if key[0] != day
+            }
+        self.input_digests[day] = digest
+
+        return module
+
+    def answer(self, day: int, part: int, memoize: bool = True, **kwargs) -> object:
+        module = self.module(day)
+        if not memoize:
+            return self.solve(module, day, part, **kwargs)
+
+        key = (day, part, tuple(sorted(kwargs.items())))
+        if key not in self.answers:
+            self.answers[key] = self.solve(module, day, part, **kwargs)
+        return self.answers[key]
+
+    def solve(self, module: ModuleType, day: int, part: int, **kwargs) -> object:
+        part_fn = getattr(module, f"part_{part}")
+        if not hasattr(module, "SolveContext"):
+            return part_fn(**kwargs)
+
+        if day not in self.contexts:
+            self.contexts[day] = module.SolveContext()
+        return part_fn(self.contexts[day], **kwargs)
+
+    def reset(self) -> None:
+        self.contexts.clear()
+        self.answers.clear()
+
+    def handle_request(self, request: dict) -> dict:
+        if request.get("command") == "reset":
+            self.reset()
+            return {"ok": True}
+
+        start = time.perf_counter()
+        try:
+            answer = self.answer(**request)
+        except Exception as e:
+            return {"error": repr(e)}
+
+        return {"answer": str(answer), "seconds": time.perf_counter() - start}
+
+
+async def serve(socket_path: str) -> None:
+    solvers = Solvers()
+
+    async def handle_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while line := await reader.readline():
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {"error": repr(e)}
+            else:
+                if isinstance(request, dict):
+                    # Parts run on the event loop itself: they're CPU-bound, so running them on
+                    # other threads wouldn't make them any faster, and this way they can share
+                    # contexts without locking.
+                    response = solvers.handle_request(request)
+                else:
+                    response = {"error": "requests must be JSON objects"}
+
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        writer.close()
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+    async with server:
+        await server.serve_forever()
+
+
+class Client:
+    """A blocking client, which keeps one connection open for all of its requests."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(socket_path)
+        self.file = self.socket.makefile("rwb")
+
+    def request(self, request: dict) -> dict:
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def query(self, day: int, part: int, **kwargs) -> dict:
+        return self.request({"day": day, "part": part, **kwargs})
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+
+def parse_query_args(args: list[str]) -> dict[str, str]:
+    return dict(arg.split("=", 1) for arg in args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("serve")
+
+    for name in ("query", "bench"):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("day", type=int)
+        subparser.add_argument("part", type=int)
+        subparser.add_argument(
+            "--arg",
+            action="append",
+            default=[],
+            help="A keyword argument for the part, like color=dim purple.",
+        )
+        if name == "bench":
+            subparser.add_argument("--requests", type=int, default=1000)
+            subparser.add_argument(
+                "--memoized",
+                action="store_true",
+                help="Time remembered answers instead of warm solves.",
+            )
+
+    subparsers.add_parser("reset")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        asyncio.run(serve(args.socket))
+        return 0
+
+    client = Client(args.socket)
+    if args.command == "reset":
+        print(client.request({"command": "reset"}))
+        return 0
+
+    kwargs = parse_query_args(args.arg)
+    if args.command == "query":
+        response = client.query(args.day, args.part, **kwargs)
+        print(response.get("answer", response.get("error")))
+        return 0 if "answer" in response else 1
+
+    kwargs["memoize"] = args.memoized
+
+    # The first request may pay for importing and parsing, so it's reported separately.
+    start = time.perf_counter()
+    client.query(args.day, args.part, **kwargs)
+    print(f"first request {time.perf_counter() - start:.6f}s")
+
+    latencies = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        client.query(args.day, args.part, **kwargs)
+        latencies.append(time.perf_counter() - start)
+
+    stats = summarize(latencies)
+    print(
+        f"{args.requests} requests: min {stats['min'] * 1000:.3f}ms "
+        f"median {stats['median'] * 1000:.3f}ms p95 {stats['p95'] * 1000:.3f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
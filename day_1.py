@@ -1,8 +1,173 @@
+import itertools
+import math
+import random
+from collections import Counter, defaultdict
+from typing import Iterable, Iterator
+
+
 def load_input(filename: str) -> list[str]:
     with open(f"inputs/{filename}") as f:
         return [line.strip() for line in f]
 
 
+def find_pairs(
+    numbers: list[int], target: int, find_all: bool
+) -> list[tuple[int, ...]]:
+    if not find_all:
+        seen = set()
+        for num in numbers:
+            if target - num in seen:
+                return [tuple(sorted((target - num, num)))]
+            seen.add(num)
+        return []
+
+    counts = Counter(numbers)
+    return [
+        (num, target - num)
+        for num in sorted(counts)
+        if (num < target - num and target - num in counts)
+        or (num == target - num and counts[num] >= 2)
+    ]
+
+
+def find_triples(
+    numbers: list[int], target: int, find_all: bool
+) -> list[tuple[int, ...]]:
+    ordered = sorted(numbers)
+    matches = []
+
+    for i, num_1 in enumerate(ordered[:-2]):
+        if i > 0 and num_1 == ordered[i - 1]:
+            continue
+        if num_1 + ordered[i + 1] + ordered[i + 2] > target:
+            # Every sum from here on is bigger than this one.
+            break
+        if num_1 + ordered[-2] + ordered[-1] < target:
+            continue
+
+        # Sweep the rest of the list from both ends at once, for two numbers that add up to what's
+        # left of the target.
+        low, high = i + 1, len(ordered) - 1
+        while low < high:
+            total = num_1 + ordered[low] + ordered[high]
+            if total < target:
+                low += 1
+            elif total > target:
+                high -= 1
+            else:
+                matches.append((num_1, ordered[low], ordered[high]))
+                if not find_all:
+                    return matches
+
+                low += 1
+                while low < high and ordered[low] == ordered[low - 1]:
+                    low += 1
+                high -= 1
+
+    return matches
+
+
+def find_k_sum_meet_in_the_middle(
+    numbers: list[int], k: int, target: int, find_all: bool
+) -> list[tuple[int, ...]]:
+    # Every combination of k indexes splits into its first k // 2 indexes and the rest, so we
+    # find sums of the smaller combinations on each side and look for pairs of them that add up
+    # to the target, with all of the first one's indexes coming before any of the second one's.
+    first_size = k // 2
+    first_halves_by_sum = defaultdict(list)
+    for indexes in itertools.combinations(range(len(numbers)), first_size):
+        values = [numbers[i] for i in indexes]
+        first_halves_by_sum[sum(values)].append((indexes[-1], values))
+
+    matches = set()
+    for indexes in itertools.combinations(range(len(numbers)), k - first_size):
+        values = [numbers[i] for i in indexes]
+        for last_index, first_values in first_halves_by_sum.get(
+            target - sum(values), []
+        ):
+            if last_index < indexes[0]:
+                matches.add(tuple(sorted(first_values + values)))
+                if not find_all:
+                    return list(matches)
+
+    return sorted(matches)
+
+
+def find_k_sum(
+    numbers: list[int], k: int, target: int, find_all: bool = False
+) -> list[tuple[int, ...]]:
+    """Finds k entries of `numbers` that add up to `target`.
+
+    Returns a list of matches, each a sorted tuple of k numbers. If `find_all` is False, the list
+    has at most one match in it; otherwise it has every distinct match.
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+
+    if k == 1:
+        return [(target,)] if target in numbers else []
+    if k == 2:
+        return find_pairs(numbers, target, find_all)
+    if k == 3:
+        return find_triples(numbers, target, find_all)
+    return find_k_sum_meet_in_the_middle(numbers, k, target, find_all)
+
+
+def iter_numbers(filename: str) -> Iterator[int]:
+    """Like load_input, but reads the file one line at a time, as the numbers are needed."""
+    with open(f"inputs/{filename}") as f:
+        for line in f:
+            if line.strip():
+                yield int(line)
+
+
+class StreamingKSum:
+    """Looks for 2 or 3 entries that add up to `target` among entries that arrive one at a time,
+    checking each new entry against the ones that came before it as soon as it arrives.
+    """
+
+    def __init__(self, k: int, target: int):
+        if k not in (2, 3):
+            raise ValueError(f"k must be 2 or 3, got {k}")
+
+        self.k = k
+        self.target = target
+        self.counts = Counter()
+
+    def add(self, num: int) -> tuple[int, ...] | None:
+        """Returns a sorted tuple of k entries that add up to the target, including `num`, if
+        there are any; otherwise None."""
+        match = self.find_match(num)
+        self.counts[num] += 1
+        return match
+
+    def find_match(self, num: int) -> tuple[int, ...] | None:
+        remainder = self.target - num
+        if self.k == 2:
+            # O(1): just look up the one number that would complete the pair.
+            return tuple(sorted((num, remainder))) if self.counts[remainder] else None
+
+        # O(n): each earlier entry only leaves one number that would complete the triple.
+        for other in self.counts:
+            last = remainder - other
+            if self.counts[last] >= 1 + (last == other):
+                return tuple(sorted((num, other, last)))
+
+        return None
+
+
+def find_k_sum_in_stream(
+    numbers: Iterable[int], k: int, target: int
+) -> tuple[int, ...] | None:
+    """Returns the first match that `numbers` complete, without consuming any more of them."""
+    detector = StreamingKSum(k, target)
+    for num in numbers:
+        if match := detector.add(num):
+            return match
+
+    return None
+
+
 # Before you leave, the Elves in accounting just need you to fix your expense
 # report (your puzzle input); apparently, something isn't quite adding up.
 #
@@ -11,12 +176,8 @@ def load_input(filename: str) -> list[str]:
 def part_1() -> int:
     numbers = [int(line) for line in load_input("day_1.txt")]
 
-    for i, num_1 in enumerate(numbers):
-        for num_2 in numbers[i + 1 :]:
-            if num_1 + num_2 == 2020:
-                return num_1 * num_2
-
-    return -1
+    matches = find_k_sum(numbers, 2, 2020)
+    return math.prod(matches[0]) if matches else -1
 
 
 # The Elves in accounting are thankful for your help; one of them even offers
@@ -28,10 +189,57 @@ def part_1() -> int:
 def part_2() -> int:
     numbers = [int(line) for line in load_input("day_1.txt")]
 
-    for i, num_1 in enumerate(numbers):
-        for j, num_2 in enumerate(numbers[i + 1 :]):
-            for num_3 in numbers[j + 1 :]:
-                if num_1 + num_2 + num_3 == 2020:
-                    return num_1 * num_2 * num_3
+    matches = find_k_sum(numbers, 3, 2020)
+    return math.prod(matches[0]) if matches else -1
+
+
+def brute_force_k_sum(numbers: list[int], k: int, target: int) -> set[tuple[int, ...]]:
+    return {
+        tuple(sorted(combination))
+        for combination in itertools.combinations(numbers, k)
+        if sum(combination) == target
+    }
+
+
+def test_find_k_sum_matches_brute_force() -> None:
+    rng = random.Random(0)
+    for _ in range(300):
+        numbers = [rng.randint(-20, 40) for _ in range(rng.randint(0, 12))]
+        k = rng.randint(1, 5)
+        target = rng.randint(-10, 80)
+        expected = brute_force_k_sum(numbers, k, target)
+
+        assert set(find_k_sum(numbers, k, target, find_all=True)) == expected
+        matches = find_k_sum(numbers, k, target)
+        assert len(matches) == min(1, len(expected))
+        assert set(matches) <= expected
+
+
+def test_find_k_sum_in_stream_matches_brute_force() -> None:
+    rng = random.Random(1)
+    for _ in range(300):
+        numbers = [rng.randint(0, 40) for _ in range(rng.randint(0, 12))]
+        k = rng.randint(2, 3)
+        target = rng.randint(0, 80)
+
+        match = find_k_sum_in_stream(numbers, k, target)
+        # The stream stops at the first number that completes a match.
+        first_complete = next(
+            (
+                i
+                for i in range(len(numbers) + 1)
+                if brute_force_k_sum(numbers[:i], k, target)
+            ),
+            None,
+        )
+        if first_complete is None:
+            assert match is None
+        else:
+            assert match in brute_force_k_sum(numbers[:first_complete], k, target)
+
 
-    return -1
+if __name__ == "__main__":
+    test_find_k_sum_matches_brute_force()
+    test_find_k_sum_in_stream_matches_brute_force()
+    print(part_1())
+    print(part_2())
@@ -1,6 +1,9 @@
 from functools import lru_cache
 
+from disk_cache import cache_parsed_input
 
+
+@cache_parsed_input("inputs/day_10.txt")
 def load_input() -> tuple[int]:
     with open("inputs/day_10.txt") as f:
         file_joltages = tuple(sorted(int(line.strip()) for line in f))
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from functools import lru_cache
 import itertools
 
+from disk_cache import cache_parsed_input
+
 # Day 11's looking like game of life; I've implemented that before
 # and have found a noticeable perf improvement from storing the grid
 # as an encapsulated 1d list rather than as a directly-accessed 2d list,
@@ -133,6 +135,7 @@ class SeatGrid:
         print()
 
 
+@cache_parsed_input("inputs/day_11.txt")
 def load_input() -> SeatGrid:
     with open("inputs/day_11.txt") as f:
         lines = [line.strip() for line in f]
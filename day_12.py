@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Literal
 
+from disk_cache import cache_parsed_input
+
 
 class Direction(Enum):
     NORTH = "N"
@@ -77,6 +79,7 @@ class Ship:
                 raise ValueError(f"Invalid action {action}")
 
 
+@cache_parsed_input("inputs/day_12.txt")
 def load_input() -> list[tuple[str, int]]:
     with open("inputs/day_12.txt") as f:
         return [(line[0], int(line[1:].strip())) for line in f]
@@ -1,6 +1,10 @@
+from functools import cached_property
 from typing import Iterator
 
+from disk_cache import cache_parsed_input
 
+
+@cache_parsed_input("inputs/day_13.txt")
 def load_input() -> tuple[int, list[int]]:
     # Your notes (your puzzle input) consist of two lines. The first line is
     # your estimate of the earliest timestamp you could depart on a bus. The
@@ -16,8 +20,20 @@ def load_input() -> tuple[int, list[int]]:
     return departure_timestamp, available_bus_ids
 
 
-def part_1() -> int:
-    departure_timestamp, bus_ids = load_input()
+class SolveContext:
+    """Holds each day 13 loader's result, so that neither one has to run more than once."""
+
+    @cached_property
+    def notes(self) -> tuple[int, list[int]]:
+        return load_input()
+
+    @cached_property
+    def indexes_and_bus_ids(self) -> list[tuple[int, int]]:
+        return load_indexes_and_bus_ids()
+
+
+def part_1(context: SolveContext | None = None) -> int:
+    departure_timestamp, bus_ids = (context or SolveContext()).notes
 
     departed_minutes_ago_per_bus = [departure_timestamp % bus_id for bus_id in bus_ids]
 
@@ -47,6 +63,7 @@ def part_1() -> int:
     )
 
 
+@cache_parsed_input("inputs/day_13.txt")
 def load_indexes_and_bus_ids() -> list[tuple[int, int]]:
     with open("inputs/day_13.txt") as f:
         lines = [line.strip() for line in f]
@@ -58,7 +75,7 @@ def load_indexes_and_bus_ids() -> list[tuple[int, int]]:
     ]
 
 
-def part_2() -> int:
+def part_2(context: SolveContext | None = None) -> int:
     # Got stuck on this one, checked https://0xdf.gitlab.io/adventofcode2020/13
     # Turns out _they_ got stuck too
     # and they just gave up and copy-pasted this code
@@ -88,10 +105,12 @@ def part_2() -> int:
             x1 += b0
         return x1
 
-    offsets = [b - i for i, b in load_indexes_and_bus_ids()]
-    return chinese_remainder([b for _, b in load_indexes_and_bus_ids()], offsets)
+    indexes_and_bus_ids = (context or SolveContext()).indexes_and_bus_ids
+    offsets = [b - i for i, b in indexes_and_bus_ids]
+    return chinese_remainder([b for _, b in indexes_and_bus_ids], offsets)
 
 
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
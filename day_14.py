@@ -1,6 +1,9 @@
 from collections import defaultdict
 
+from disk_cache import cache_parsed_input
 
+
+@cache_parsed_input("inputs/day_14.txt")
 def load_input() -> list[str]:
     with open("inputs/day_14.txt") as f:
         return [line.strip() for line in f]
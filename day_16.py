@@ -1,4 +1,7 @@
 import functools
+from functools import cached_property
+
+from disk_cache import cache_parsed_input
 
 # The type of a dict representing input lines like:
 #     departure location: 32-174 or 190-967
@@ -7,6 +10,7 @@ import functools
 FieldRanges = dict[str, tuple[tuple[int, int], tuple[int, int]]]
 
 
+@cache_parsed_input("inputs/day_16.txt")
 def parse_input() -> tuple[FieldRanges, tuple[int], tuple[tuple[int]]]:
     with open("inputs/day_16.txt") as f:
         lines = [line.strip() for line in f]
@@ -50,21 +54,36 @@ def find_invalid_value_in_ticket(ticket: tuple[int], field_ranges: FieldRanges)
     return 0
 
 
-def part_1() -> int:
-    field_ranges, _, nearby_tickets = parse_input()
+class SolveContext:
+    """Both parts check every nearby ticket for invalid values, so that's only done once, here."""
 
-    return sum(
-        find_invalid_value_in_ticket(ticket, field_ranges) for ticket in nearby_tickets
-    )
+    @cached_property
+    def parsed_input(self) -> tuple[FieldRanges, tuple[int], tuple[tuple[int]]]:
+        return parse_input()
+
+    @cached_property
+    def invalid_value_per_nearby_ticket(self) -> list[int]:
+        field_ranges, _, nearby_tickets = self.parsed_input
+        return [
+            find_invalid_value_in_ticket(ticket, field_ranges)
+            for ticket in nearby_tickets
+        ]
 
 
-def part_2() -> int:
-    field_ranges, your_ticket, nearby_tickets = parse_input()
+def part_1(context: SolveContext | None = None) -> int:
+    return sum((context or SolveContext()).invalid_value_per_nearby_ticket)
+
+
+def part_2(context: SolveContext | None = None) -> int:
+    context = context or SolveContext()
+    field_ranges, your_ticket, nearby_tickets = context.parsed_input
 
     valid_tickets = [
         ticket
-        for ticket in nearby_tickets
-        if find_invalid_value_in_ticket(ticket, field_ranges) == 0
+        for ticket, invalid_value in zip(
+            nearby_tickets, context.invalid_value_per_nearby_ticket
+        )
+        if invalid_value == 0
     ]
 
     # `your_ticket` has N ordered field values - right now, any one of those values
@@ -127,5 +146,6 @@ def part_2() -> int:
 
 
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
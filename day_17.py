@@ -4,6 +4,8 @@
 from dataclasses import dataclass
 from typing import Literal
 
+from disk_cache import cache_parsed_input
+
 
 @dataclass
 class Bounds:
@@ -20,6 +22,7 @@ class Bounds:
 Coordinates = tuple[int, int, int, int]
 
 
+@cache_parsed_input("inputs/day_17.txt")
 def load_input() -> tuple[set[Coordinates], Bounds]:
     with open("inputs/day_17.txt") as f:
         lines = [line.strip() for line in f]
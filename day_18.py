@@ -2,6 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
+from disk_cache import cache_parsed_input
+
 
 @dataclass
 class Expression:
@@ -143,6 +145,7 @@ def replace_parenthesized_expressions_with_ints(
     replace_parenthesized_expressions_with_ints(expression, evaluate_leaf_expression_fn)
 
 
+@cache_parsed_input("inputs/day_18.txt")
 def load_input() -> list[str]:
     with open("inputs/day_18.txt") as f:
         return [line.strip() for line in f]
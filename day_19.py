@@ -1,6 +1,9 @@
 from typing import Iterator
 
+from disk_cache import cache_parsed_input
 
+
+@cache_parsed_input("inputs/day_19.txt")
 def load_input() -> tuple[dict[str, str], list[str]]:
     with open("inputs/day_19.txt") as f:
         lines = [line.strip() for line in f]
@@ -1,8 +1,18 @@
+import concurrent.futures
+import os
 import re
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Iterator
 
+from disk_cache import cache_parsed_input
 
 INPUT_RE = re.compile(r"(\d+)-(\d+) (\w): (\w+)")
 
+# The same pattern, for matching against the raw bytes of a whole input file at once.
+INPUT_BYTES_RE = re.compile(rb"(\d+)-(\d+) (\w): (\w+)")
+
 
 def is_password_valid_part_1(input_line: str) -> bool:
     min_occurrences, max_occurrences, char, password = re.match(
@@ -14,17 +24,6 @@ def is_password_valid_part_1(input_line: str) -> bool:
     return min_occurrences <= password.count(char) <= max_occurrences
 
 
-# Each line gives the password policy and then the password. The password policy
-# indicates the lowest and highest number of times a given letter must appear
-# for the password to be valid. For example, 1-3 a means that the password must
-# contain a at least 1 time and at most 3 times.
-def part_1() -> int:
-    with open("inputs/day_2.txt") as f:
-        lines = [line.strip() for line in f]
-
-    return sum(is_password_valid_part_1(line) for line in lines)
-
-
 def is_password_valid_part_2(input_line: str) -> bool:
     index_1, index_2, char, password = re.match(INPUT_RE, input_line).groups()
 
@@ -37,11 +36,171 @@ def is_password_valid_part_2(input_line: str) -> bool:
     return char_1 == char or char_2 == char
 
 
-def part_2() -> int:
-    with open("inputs/day_2.txt") as f:
-        lines = [line.strip() for line in f]
+@dataclass
+class PasswordDatabase:
+    """Every line of a password file, stored column by column.
+
+    Passwords aren't copied out of the file: password i is
+    data[password_starts[i]:password_ends[i]].
+    """
+
+    data: bytes
+    lows: array = field(default_factory=lambda: array("I"))
+    highs: array = field(default_factory=lambda: array("I"))
+    chars: bytearray = field(default_factory=bytearray)
+    password_starts: array = field(default_factory=lambda: array("Q"))
+    password_ends: array = field(default_factory=lambda: array("Q"))
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+
+def parse_password_database(data: bytes) -> PasswordDatabase:
+    database = PasswordDatabase(data)
+    for match in INPUT_BYTES_RE.finditer(data):
+        database.lows.append(int(match[1]))
+        database.highs.append(int(match[2]))
+        database.chars.append(match[3][0])
+        database.password_starts.append(match.start(4))
+        database.password_ends.append(match.end(4))
+
+    return database
+
+
+@cache_parsed_input("inputs/day_2.txt")
+def load_input() -> PasswordDatabase:
+    with open("inputs/day_2.txt", "rb") as f:
+        return parse_password_database(f.read())
+
+
+def count_valid_passwords(database: PasswordDatabase) -> tuple[int, int]:
+    """Returns how many passwords are valid under part 1's policy, and how many under part 2's,
+    checking both policies in a single pass over the database."""
+    data = database.data
+    num_valid_part_1 = 0
+    num_valid_part_2 = 0
+
+    for low, high, char, start, end in zip(
+        database.lows,
+        database.highs,
+        database.chars,
+        database.password_starts,
+        database.password_ends,
+    ):
+        # Counting within the original buffer avoids making a copy of each password.
+        num_valid_part_1 += low <= data.count(char, start, end) <= high
+        # A position past the end of the password doesn't match, rather than reading on into the
+        # next line. (Position 0 lands on the space before the password, which can't match either.)
+        num_valid_part_2 += (
+            start + low - 1 < end and data[start + low - 1] == char
+        ) != (start + high - 1 < end and data[start + high - 1] == char)
+
+    return num_valid_part_1, num_valid_part_2
+
+
+def find_shards(filename: str, num_shards: int) -> list[tuple[int, int]]:
+    """Splits `filename` into about `num_shards` (start, end) byte ranges of similar size, each of
+    which starts at the beginning of a line and ends at the end of one."""
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as f:
+        for i in range(1, num_shards):
+            f.seek(max(size * i // num_shards, boundaries[-1]))
+            # Skip ahead to the start of the next line.
+            f.readline()
+            boundaries.append(f.tell())
+    boundaries.append(size)
+
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+
+
+def iter_blocks(
+    filename: str, start: int, end: int, block_size: int
+) -> Iterator[bytes]:
+    """Yields the bytes of `filename` between `start` and `end`, about `block_size` bytes at a time,
+    with every block ending at the end of a line."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        leftover = b""
+
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+
+            block = leftover + block
+            cut = block.rfind(b"\n") + 1
+            leftover = block[cut:]
+            if cut:
+                yield block[:cut]
+
+        if leftover:
+            yield leftover
+
+
+def count_valid_passwords_in_shard(
+    filename: str, start: int, end: int, block_size: int
+) -> tuple[int, int]:
+    num_valid_part_1 = 0
+    num_valid_part_2 = 0
+
+    # Only one block of the shard is in memory at a time, however big the shard is.
+    for block in iter_blocks(filename, start, end, block_size):
+        block_valid_part_1, block_valid_part_2 = count_valid_passwords(
+            parse_password_database(block)
+        )
+        num_valid_part_1 += block_valid_part_1
+        num_valid_part_2 += block_valid_part_2
+
+    return num_valid_part_1, num_valid_part_2
+
+
+def count_valid_passwords_sharded(
+    filename: str, jobs: int | None = None, block_size: int = 2**20
+) -> tuple[int, int]:
+    """Like count_valid_passwords, for a whole file, but splits the file into one shard per job
+    and validates the shards in parallel, in a pool of `jobs` processes."""
+    jobs = jobs or os.cpu_count()
+    shards = find_shards(filename, jobs)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        counts = list(
+            executor.map(
+                count_valid_passwords_in_shard,
+                *zip(*[(filename, start, end, block_size) for start, end in shards]),
+            )
+        )
+
+    return sum(count[0] for count in counts), sum(count[1] for count in counts)
+
+
+class SolveContext:
+    """Both parts' answers come out of the same pass over the input, so they're computed once and
+    kept here."""
+
+    @cached_property
+    def database(self) -> PasswordDatabase:
+        return load_input()
+
+    @cached_property
+    def valid_counts(self) -> tuple[int, int]:
+        return count_valid_passwords(self.database)
+
+
+# Each line gives the password policy and then the password. The password policy
+# indicates the lowest and highest number of times a given letter must appear
+# for the password to be valid. For example, 1-3 a means that the password must
+# contain a at least 1 time and at most 3 times.
+def part_1(context: SolveContext | None = None) -> int:
+    return (context or SolveContext()).valid_counts[0]
+
 
-    return sum(is_password_valid_part_2(line) for line in lines)
+def part_2(context: SolveContext | None = None) -> int:
+    return (context or SolveContext()).valid_counts[1]
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from functools import cached_property, reduce
 from typing import Collection, Iterator, Sequence
 
+from disk_cache import cache_parsed_input
+
 
 @dataclass
 class Tile:
@@ -57,6 +59,7 @@ def flip_tile(tile: Tile) -> Tile:
     return Tile(id=tile.id, data=flip_image(tile.data))
 
 
+@cache_parsed_input("inputs/day_20.txt")
 def load_input() -> list[Tile]:
     with open("inputs/day_20.txt") as f:
         lines = [line.strip() for line in f]
@@ -162,11 +165,22 @@ def get_bounds(placed_tiles: dict[tuple[int, int], Tile]) -> tuple[int, int, int
     )
 
 
-def part_1() -> int:
-    tiles = load_input()
+class SolveContext:
+    """Assembling the image is by far the slowest step of either part, so it's only done once."""
+
+    @cached_property
+    def placed_tiles(self) -> dict[tuple[int, int], Tile]:
+        return place_tiles(load_input())
 
-    placed_tiles = place_tiles(tiles)
-    min_x, max_x, min_y, max_y = get_bounds(placed_tiles)
+    @cached_property
+    def bounds(self) -> tuple[int, int, int, int]:
+        return get_bounds(self.placed_tiles)
+
+
+def part_1(context: SolveContext | None = None) -> int:
+    context = context or SolveContext()
+    placed_tiles = context.placed_tiles
+    min_x, max_x, min_y, max_y = context.bounds
 
     return (
         placed_tiles[(min_x, min_y)].id
@@ -212,11 +226,10 @@ def count_sea_monsters_in_image(image: list[str]) -> int:
     return result
 
 
-def part_2() -> int:
-    tiles = load_input()
-
-    placed_tiles = place_tiles(tiles)
-    min_x, max_x, min_y, max_y = get_bounds(placed_tiles)
+def part_2(context: SolveContext | None = None) -> int:
+    context = context or SolveContext()
+    placed_tiles = context.placed_tiles
+    min_x, max_x, min_y, max_y = context.bounds
 
     # "The borders of each tile are not part of the actual image; start by removing them."
     image = []
@@ -386,5 +399,6 @@ if __name__ == "__main__":
     test_counting()
     test_matching()
     test_matching_handles_directionality_correctly()
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from functools import cached_property
+
+from disk_cache import cache_parsed_input
 
 
 @dataclass
@@ -7,6 +10,7 @@ class Food:
     allergens: list[str]
 
 
+@cache_parsed_input("inputs/day_21.txt")
 def load_input() -> list[Food]:
     with open("inputs/day_21.txt") as f:
         lines = [line.strip() for line in f]
@@ -37,10 +41,24 @@ def allergen_candidates(foods: list[Food]) -> dict[str, set[str]]:
     }
 
 
-def part_1() -> int:
-    foods = load_input()
-    candidates = allergen_candidates(foods)
-    potentially_allergenic_ingredients = set.union(*candidates.values())
+class SolveContext:
+    """Keeps the foods and their allergen candidates around for whichever part runs second."""
+
+    @cached_property
+    def foods(self) -> list[Food]:
+        return load_input()
+
+    @cached_property
+    def allergen_candidates(self) -> dict[str, set[str]]:
+        return allergen_candidates(self.foods)
+
+
+def part_1(context: SolveContext | None = None) -> int:
+    context = context or SolveContext()
+    foods = context.foods
+    potentially_allergenic_ingredients = set.union(
+        *context.allergen_candidates.values()
+    )
 
     # "Determine which ingredients cannot possibly contain any of the allergens
     # in your list. How many times do any of those ingredients appear?"
@@ -52,9 +70,14 @@ def part_1() -> int:
     )
 
 
-def part_2() -> str:
-    foods = load_input()
-    candidates = allergen_candidates(foods)
+def part_2(context: SolveContext | None = None) -> str:
+    context = context or SolveContext()
+
+    # Process of elimination empties out these sets, so work on copies of them.
+    candidates = {
+        allergen: set(ingredients)
+        for allergen, ingredients in context.allergen_candidates.items()
+    }
 
     # "Now that you've isolated the inert ingredients, you should have enough
     # information to figure out which ingredient contains which allergen."
@@ -86,5 +109,6 @@ def part_2() -> str:
 
 
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
@@ -1,12 +1,15 @@
 from collections import deque
 from enum import Enum, auto
 
+from disk_cache import cache_parsed_input
+
 
 class WhichPlayer(Enum):
     ME = auto()
     CRAB = auto()
 
 
+@cache_parsed_input("inputs/day_22.txt")
 def load_input() -> tuple[deque[int], deque[int]]:
     with open("inputs/day_22.txt") as f:
         lines = [line.strip() for line in f]
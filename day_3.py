@@ -1,27 +1,75 @@
-def load_map() -> list[str]:
+import itertools
+import math
+from dataclasses import dataclass
+from operator import and_, rshift
+
+from disk_cache import cache_parsed_input
+
+# Turns a row of the map, reversed, into a binary number.
+ROW_TO_BINARY = str.maketrans(".#", "01")
+
+
+@dataclass
+class TreeMap:
+    """The map of open squares (.) and trees (#), with each row stored as an int whose bit x is
+    set if there's a tree in column x."""
+
+    width: int
+    rows: list[int]
+
+    @staticmethod
+    def from_lines(lines: list[str]) -> "TreeMap":
+        return TreeMap(
+            width=len(lines[0]) if lines else 0,
+            rows=[int(line[::-1].translate(ROW_TO_BINARY), 2) for line in lines],
+        )
+
+
+@cache_parsed_input("inputs/day_3.txt")
+def load_map() -> TreeMap:
     with open("inputs/day_3.txt") as f:
-        return [line.strip() for line in f]
+        return TreeMap.from_lines([line.strip() for line in f if line.strip()])
 
 
-def find_num_trees_on_slope(tree_map: list[str], slope: tuple[int, int]) -> int:
-    tree_map = load_map()
-    map_width = len(tree_map[0])
+def count_trees_on_slopes(
+    tree_map: TreeMap, slopes: list[tuple[int, int]]
+) -> list[int]:
+    """Returns how many trees you'd encounter on each of `slopes`.
 
-    # You start on the open square (.) in the top-left corner and need to reach
-    # the bottom (below the bottom-most row on your map).
-    x, y = 0, 0
-    num_trees_seen = 0
+    Each row only needs to be looked at once per slope, with one shift and one mask, so the
+    per-row work can all be done by chaining map, itertools and sum together, without a loop
+    written in Python.
+    """
+    map_width = tree_map.width
+    rows_by_dy = {}
+    nums_trees_seen = []
 
-    while y < len(tree_map):
-        if tree_map[y][x] == "#":
-            num_trees_seen += 1
+    for dx, dy in slopes:
+        # You start on the open square (.) in the top-left corner and need to reach
+        # the bottom (below the bottom-most row on your map).
+        if dy not in rows_by_dy:
+            rows_by_dy[dy] = tree_map.rows[::dy]
 
-        y += slope[1]
         # Due to something you read about once involving arboreal genetics and
         # biome stability, the same pattern repeats to the right many times.
-        x = (x + slope[0]) % map_width
+        # So the x positions we visit repeat too, every so many rows.
+        xs = [i * dx % map_width for i in range(map_width // math.gcd(dx, map_width))]
+
+        nums_trees_seen.append(
+            sum(
+                map(
+                    and_,
+                    map(rshift, rows_by_dy[dy], itertools.cycle(xs)),
+                    itertools.repeat(1),
+                )
+            )
+        )
+
+    return nums_trees_seen
 
-    return num_trees_seen
+
+def find_num_trees_on_slope(tree_map: TreeMap, slope: tuple[int, int]) -> int:
+    return count_trees_on_slopes(tree_map, [slope])[0]
 
 
 def part_1() -> int:
@@ -32,16 +80,11 @@ def part_1() -> int:
 
 
 def part_2() -> int:
-    tree_map = load_map()
-    result = 1
-
     # Determine the number of trees you would encounter if, for each of the
     # following slopes, you start at the top-left corner and traverse the map
     # all the way to the bottom.
-    for slope in [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]:
-        result *= find_num_trees_on_slope(tree_map, slope)
-
-    return result
+    slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+    return math.prod(count_trees_on_slopes(load_map(), slopes))
 
 
 if __name__ == "__main__":
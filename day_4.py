@@ -1,33 +1,192 @@
+import itertools
 import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
 
-from util import load_line_groups_from_file
+from util import iter_line_groups_from_file
 
+# A compiled rule, which takes a field's value and returns something truthy if it's valid.
+Check = Callable[[str], object]
 
-def height_is_valid(passport_value: str) -> bool:
-    if passport_value.endswith("cm"):
-        return 150 <= int(passport_value[:-2]) <= 193
-    elif passport_value.endswith("in"):
-        return 59 <= int(passport_value[:-2]) <= 76
-    else:
+
+def parses_as_int_between(value: str, low: int, high: int) -> bool:
+    try:
+        return low <= int(value) <= high
+    except ValueError:
         return False
 
 
-PASSPORT_FIELD_VALIDATORS = {
-    "byr": lambda v: 1920 <= int(v) <= 2002,
-    "iyr": lambda v: 2010 <= int(v) <= 2020,
-    "eyr": lambda v: 2020 <= int(v) <= 2030,
-    "hgt": height_is_valid,
-    "hcl": lambda v: re.match(r"#[0-9a-f]{6,6}", v),
-    "ecl": lambda v: v in {"amb", "blu", "brn", "gry", "grn", "hzl", "oth"},
-    "pid": lambda v: re.match(r"^\d{9,9}$", v),
-    "cid": lambda v: True,
+@dataclass(frozen=True)
+class IntRange:
+    low: int
+    high: int
+
+    def compile(self) -> Check:
+        low, high = self.low, self.high
+
+        def check(value: str) -> bool:
+            return parses_as_int_between(value, low, high)
+
+        return check
+
+
+@dataclass(frozen=True)
+class UnitRanges:
+    """A number followed by a unit, where each unit has its own range, like 150cm or 59in."""
+
+    ranges: tuple[tuple[str, int, int], ...]
+
+    def compile(self) -> Check:
+        ranges = self.ranges
+
+        def check(value: str) -> bool:
+            for unit, low, high in ranges:
+                if value.endswith(unit):
+                    return parses_as_int_between(value[: -len(unit)], low, high)
+            return False
+
+        return check
+
+
+@dataclass(frozen=True)
+class OneOf:
+    values: frozenset[str]
+
+    def compile(self) -> Check:
+        return self.values.__contains__
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A regex that has to match at the start of the value, like with re.match."""
+
+    regex: str
+
+    def compile(self) -> Check:
+        return re.compile(self.regex).match
+
+
+@dataclass(frozen=True)
+class Anything:
+    def compile(self) -> Check:
+        return lambda value: True
+
+
+Rule = IntRange | UnitRanges | OneOf | Pattern | Anything
+
+
+PASSPORT_SCHEMA: dict[str, Rule] = {
+    "byr": IntRange(1920, 2002),
+    "iyr": IntRange(2010, 2020),
+    "eyr": IntRange(2020, 2030),
+    "hgt": UnitRanges((("cm", 150, 193), ("in", 59, 76))),
+    "hcl": Pattern(r"#[0-9a-f]{6,6}"),
+    "ecl": OneOf(frozenset({"amb", "blu", "brn", "gry", "grn", "hzl", "oth"})),
+    "pid": Pattern(r"^\d{9,9}$"),
+    "cid": Anything(),
 }
 
+# It's ok to be missing 'cid', but all other fields must be present.
+REQUIRED_PASSPORT_FIELDS = frozenset(PASSPORT_SCHEMA) - {"cid"}
+
+
+class PassportValidator:
+    """A schema whose rules have been compiled into checks up front, which checks a passport's
+    fields one at a time and gives up at the first one that's missing or invalid.
 
-ALL_PASSPORT_FIELDS = PASSPORT_FIELD_VALIDATORS.keys()
+    Fields that nothing is ever rejected for (like 'cid') aren't checked at all. The rest are
+    checked in `field_order` if one is given, which should put the fields that reject the most
+    passports first; see order_fields_by_rejection_rate.
+    """
 
+    def __init__(
+        self,
+        schema: dict[str, Rule],
+        required_fields: frozenset[str],
+        check_values: bool = True,
+        field_order: list[str] | None = None,
+    ):
+        self.schema = schema
+        # (field, whether it's required, its compiled check or None), in the order they're checked.
+        self.steps: list[tuple[str, bool, Check | None]] = []
+        for field_name in field_order or schema:
+            rule = schema[field_name]
+            required = field_name in required_fields
+            has_check = check_values and not isinstance(rule, Anything)
+            if required or has_check:
+                self.steps.append(
+                    (field_name, required, rule.compile() if has_check else None)
+                )
 
-def parse_input() -> list[dict[str, str]]:
+    def is_valid(self, passport: dict[str, str]) -> bool:
+        get = passport.get
+        for field_name, required, check in self.steps:
+            value = get(field_name)
+            if value is None:
+                if required:
+                    return False
+            elif check is not None and not check(value):
+                return False
+
+        return True
+
+    def find_rejections(self, passport: dict[str, str]) -> list[tuple[str, str]]:
+        """Like is_valid, but checks every field and returns a list of (field, "missing" or
+        "invalid") for each one that rejects the passport, which is empty if nothing does. It's
+        slower, so it's only used when collecting RejectionStats."""
+        get = passport.get
+        rejections = []
+        for field_name, required, check in self.steps:
+            value = get(field_name)
+            if value is None:
+                if required:
+                    rejections.append((field_name, "missing"))
+            elif check is not None and not check(value):
+                rejections.append((field_name, "invalid"))
+
+        return rejections
+
+    def validate_all(self, passports: Iterable[dict[str, str]]) -> list[bool]:
+        return list(map(self.is_valid, passports))
+
+    def count_valid(self, passports: Iterable[dict[str, str]]) -> int:
+        return sum(map(self.is_valid, passports))
+
+
+@dataclass
+class RejectionStats:
+    """How many passports a validator has checked and rejected, and how many times it's rejected
+    a passport for each (field, reason) pair, where the reason is "missing" or "invalid".
+
+    Every field that rejects a passport is counted, not just the first one, so the totals don't
+    depend on the order the validator checks fields in.
+    """
+
+    num_checked: int = 0
+    num_rejected: int = 0
+    rejections: Counter[tuple[str, str]] = field(default_factory=Counter)
+
+    @property
+    def num_valid(self) -> int:
+        return self.num_checked - self.num_rejected
+
+    def rejections_by_field(self) -> Counter[str]:
+        by_field = Counter()
+        for (field_name, _), count in self.rejections.items():
+            by_field[field_name] += count
+        return by_field
+
+    def report(self, schema: dict[str, Rule]) -> str:
+        lines = [f"{self.num_valid} of {self.num_checked} passports valid"]
+        for (field_name, reason), count in self.rejections.most_common():
+            rule = f" {schema[field_name]}" if reason == "invalid" else ""
+            lines.append(f"    {count:>10} {field_name} {reason}{rule}")
+        return "\n".join(lines)
+
+
+def parse_passports(filename: str) -> Iterator[dict[str, str]]:
+    """Yields the passports in `filename` as they're read, so only one is in memory at a time."""
     # input file has groups of lines like
 
     # iyr:1928 cid:150 pid:476113241 eyr:2039 hcl:a5ac0f
@@ -36,44 +195,95 @@ def parse_input() -> list[dict[str, str]]:
     #
     # hgt:168cm eyr:2026 ecl:hzl hcl:#fffffd cid:169 pid:920076943
     # byr:1929 iyr:2013
-    grouped_lines = load_line_groups_from_file("inputs/day_4.txt")
-
-    passports = []
-
-    for group in grouped_lines:
-        passport_in_progress = {}
+    for group in iter_line_groups_from_file(filename):
+        passport = {}
         for line in group:
             for item in line.split(" "):
                 key, value = item.split(":")
-                passport_in_progress[key] = value
+                passport[key] = value
+
+        yield passport
+
+
+def iter_verdicts(
+    validator: PassportValidator,
+    passports: Iterable[dict[str, str]],
+    stats: RejectionStats | None = None,
+) -> Iterator[bool]:
+    """Yields whether each of `passports` is valid, as it comes in. If `stats` is given, it's kept
+    up to date with every passport checked so far."""
+    if stats is None:
+        yield from map(validator.is_valid, passports)
+        return
+
+    find_rejections = validator.find_rejections
+    counts = stats.rejections
 
-        passports.append(passport_in_progress)
+    for passport in passports:
+        stats.num_checked += 1
+        rejections = find_rejections(passport)
+        if rejections:
+            stats.num_rejected += 1
+            counts.update(rejections)
+            yield False
+        else:
+            yield True
 
-    return passports
 
+def order_fields_by_rejection_rate(
+    schema: dict[str, Rule],
+    required_fields: frozenset[str],
+    sample: list[dict[str, str]],
+) -> list[str]:
+    """Returns the schema's fields, ordered by how many of the `sample` passports each one
+    rejects on its own (by being missing or invalid), most first."""
 
-def does_passport_have_required_keys(passport: dict[str, str]) -> bool:
-    # it's ok to be missing 'cid', but all other fields must be present
-    missing_keys = ALL_PASSPORT_FIELDS - set(passport.keys())
-    return not missing_keys or missing_keys == {"cid"}
+    def num_rejected(field: str) -> int:
+        validator = PassportValidator({field: schema[field]}, required_fields & {field})
+        return len(sample) - validator.count_valid(sample)
 
+    return sorted(schema, key=num_rejected, reverse=True)
+
+
+REQUIRED_KEYS_VALIDATOR = PassportValidator(
+    PASSPORT_SCHEMA, REQUIRED_PASSPORT_FIELDS, check_values=False
+)
+PASSPORT_VALIDATOR = PassportValidator(PASSPORT_SCHEMA, REQUIRED_PASSPORT_FIELDS)
+
+
+def count_valid_passports_in_file(
+    filename: str,
+    check_values: bool = True,
+    stats: RejectionStats | None = None,
+    sample_size: int = 100,
+) -> int:
+    """Counts the valid passports in `filename` in a single streaming pass. When checking values,
+    the first `sample_size` passports are used to pick the order the fields are checked in.
+    """
+    passports = parse_passports(filename)
+
+    if check_values:
+        sample = list(itertools.islice(passports, sample_size))
+        passports = itertools.chain(sample, passports)
+        validator = PassportValidator(
+            PASSPORT_SCHEMA,
+            REQUIRED_PASSPORT_FIELDS,
+            field_order=order_fields_by_rejection_rate(
+                PASSPORT_SCHEMA, REQUIRED_PASSPORT_FIELDS, sample
+            ),
+        )
+    else:
+        validator = REQUIRED_KEYS_VALIDATOR
 
-def is_passport_valid(passport: dict[str, str]) -> bool:
-    return does_passport_have_required_keys(passport) and all(
-        PASSPORT_FIELD_VALIDATORS[k](v) for (k, v) in passport.items()
-    )
+    return sum(iter_verdicts(validator, passports, stats))
 
 
 def part_1() -> int:
-    passports = parse_input()
-    return sum(
-        1 for passport in passports if does_passport_have_required_keys(passport)
-    )
+    return count_valid_passports_in_file("inputs/day_4.txt", check_values=False)
 
 
 def part_2() -> int:
-    passports = parse_input()
-    return sum(1 for passport in passports if is_passport_valid(passport))
+    return count_valid_passports_in_file("inputs/day_4.txt")
 
 
 if __name__ == "__main__":
@@ -1,39 +1,84 @@
+from disk_cache import cache_parsed_input
+
 NUM_ROWS_ON_PLANE = 128
 NUM_COLUMNS_ON_PLANE = 8
 
+# Each F or L halves the range of possible seats by keeping the lower half, and each B or R by
+# keeping the upper half, so a boarding pass is just its seat's ID written in binary.
+BOARDING_PASS_TO_BINARY = str.maketrans("FBLR", "0101")
+BOARDING_PASS_BYTES_TO_BINARY = bytes.maketrans(b"FBLR", b"0101")
 
-def load_boarding_passes() -> list[str]:
-    with open("inputs/day_5.txt") as f:
-        return [line.strip() for line in f]
 
+def decode_seat_ids(data: bytes) -> list[int]:
+    """Returns the seat ID of every boarding pass in `data`, which has one per line."""
+    return [
+        int(code, 2) for code in data.translate(BOARDING_PASS_BYTES_TO_BINARY).split()
+    ]
 
-def parse_boarding_pass(boarding_pass: str) -> tuple[int, int]:
-    row_range = [0, NUM_ROWS_ON_PLANE - 1]
-    for char in boarding_pass[:7]:
-        half_row_range_difference = (row_range[1] - row_range[0]) // 2 + 1
-        if char == "F":
-            row_range[1] -= half_row_range_difference
-        else:
-            row_range[0] += half_row_range_difference
 
-    col_range = [0, NUM_COLUMNS_ON_PLANE - 1]
-    for char in boarding_pass[7:]:
-        half_col_range_difference = (col_range[1] - col_range[0]) // 2 + 1
-        if char == "L":
-            col_range[1] -= half_col_range_difference
-        else:
-            col_range[0] += half_col_range_difference
+@cache_parsed_input("inputs/day_5.txt")
+def load_seat_ids() -> list[int]:
+    with open("inputs/day_5.txt", "rb") as f:
+        return decode_seat_ids(f.read())
 
-    assert row_range[0] == row_range[1]
-    assert col_range[0] == col_range[1]
 
+def parse_boarding_pass(boarding_pass: str) -> int:
     # Every seat also has a unique seat ID: multiply the row by 8, then add the column.
-    return row_range[0] * 8 + col_range[0]
+    # The column takes up the last three bits, so that's the same as reading the whole boarding
+    # pass as one binary number.
+    return int(boarding_pass.translate(BOARDING_PASS_TO_BINARY), 2)
+
+
+class SeatMap:
+    """Which seats on a plane are taken, as a bitmap with bit i set if seat ID i is taken.
+
+    Both dimensions of the plane have to be powers of two, since each character of a boarding
+    pass halves one of them.
+    """
+
+    def __init__(
+        self,
+        seat_ids: list[int],
+        num_rows: int = NUM_ROWS_ON_PLANE,
+        num_columns: int = NUM_COLUMNS_ON_PLANE,
+    ):
+        self.num_seats = num_rows * num_columns
+        if seat_ids and not 0 <= min(seat_ids) <= max(seat_ids) < self.num_seats:
+            raise ValueError(f"seat IDs must be between 0 and {self.num_seats - 1}")
+
+        bitmap = bytearray((self.num_seats + 7) // 8)
+        for seat_id in seat_ids:
+            bitmap[seat_id >> 3] |= 1 << (seat_id & 7)
+
+        # The queries below are all shifts and masks of this one int, which Python does a machine
+        # word at a time.
+        self.taken = int.from_bytes(bitmap, "little")
+
+    def highest_taken_seat(self) -> int | None:
+        return self.taken.bit_length() - 1 if self.taken else None
+
+    def seat_ids_in(self, bitmap: int) -> list[int]:
+        """Returns the IDs of the seats whose bits are set in `bitmap`, in order."""
+        bits = format(bitmap & ((1 << self.num_seats) - 1), f"0{self.num_seats}b")[::-1]
+
+        seat_ids = []
+        seat_id = bits.find("1")
+        while seat_id != -1:
+            seat_ids.append(seat_id)
+            seat_id = bits.find("1", seat_id + 1)
+        return seat_ids
+
+    def free_seats(self) -> list[int]:
+        return self.seat_ids_in(~self.taken)
+
+    def free_seats_between_taken_seats(self) -> list[int]:
+        """Returns the free seats whose IDs +1 and -1 are both taken."""
+        return self.seat_ids_in(~self.taken & (self.taken << 1) & (self.taken >> 1))
 
 
 def part_1() -> int:
     # As a sanity check, look through your list of boarding passes. What is the highest seat ID on a boarding pass?
-    return max(map(parse_boarding_pass, load_boarding_passes()))
+    return SeatMap(load_seat_ids()).highest_taken_seat()
 
 
 def part_2() -> int:
@@ -43,10 +88,7 @@ def part_2() -> int:
     # they'll be missing from your list as well.  Your seat wasn't at the very
     # front or back, though; the seats with IDs +1 and -1 from yours will be in
     # your list.  What is the ID of your seat?
-    seats = list(sorted(map(parse_boarding_pass, load_boarding_passes())))
-    for i, seat in enumerate(seats):
-        if seats[i + 1] - seat > 1:
-            return seat + 1
+    return SeatMap(load_seat_ids()).free_seats_between_taken_seats()[0]
 
 
 if __name__ == "__main__":
@@ -1,37 +1,57 @@
 import functools
 import string
+from functools import cached_property
+from operator import and_, or_
 
+from disk_cache import cache_parsed_input
 from util import load_line_groups_from_file
 
+# Each question is one bit of a 26-bit mask, with a in bit 0 and z in bit 25.
+QUESTION_BITS = {char: 1 << i for i, char in enumerate(string.ascii_lowercase)}
+
+
+def answers_to_mask(answers: str) -> int:
+    return functools.reduce(or_, map(QUESTION_BITS.__getitem__, answers), 0)
+
+
+@cache_parsed_input("inputs/day_6.txt")
+def load_group_masks() -> list[tuple[int, int]]:
+    """Returns (questions anyone answered "yes" to, questions everyone answered "yes" to) for each
+    group, as masks."""
+    group_masks = []
+    for group_answers in load_line_groups_from_file("inputs/day_6.txt"):
+        person_masks = list(map(answers_to_mask, group_answers))
+        group_masks.append(
+            (functools.reduce(or_, person_masks), functools.reduce(and_, person_masks))
+        )
+
+    return group_masks
 
-def part_1() -> int:
-    # For each group, count the number of questions to which anyone answered "yes". What is the sum of those counts?
-    unprocessed_group_answers = load_line_groups_from_file("inputs/day_6.txt")
-    processed_group_answers = [
-        functools.reduce(lambda x, y: x | set(y), group_answers, set())
-        for group_answers in unprocessed_group_answers
-    ]
 
-    return sum(map(len, processed_group_answers))
+class SolveContext:
+    """Both parts come out of the same masks, so they're only loaded once."""
 
+    @cached_property
+    def group_masks(self) -> list[tuple[int, int]]:
+        return load_group_masks()
 
-def part_2() -> int:
+
+def part_1(context: SolveContext | None = None) -> int:
+    # For each group, count the number of questions to which anyone answered "yes". What is the sum of those counts?
+    group_masks = (context or SolveContext()).group_masks
+    return sum(anyone.bit_count() for anyone, _ in group_masks)
+
+
+def part_2(context: SolveContext | None = None) -> int:
     # As you finish the last group's customs declaration, you notice that you
     # misread one word in the instructions: You don't need to identify the
     # questions to which anyone answered "yes"; you need to identify the
     # questions to which everyone answered "yes"!
-
-    unprocessed_group_answers = load_line_groups_from_file("inputs/day_6.txt")
-    processed_group_answers = [
-        functools.reduce(
-            lambda x, y: x & set(y), group_answers, set(string.ascii_lowercase)
-        )
-        for group_answers in unprocessed_group_answers
-    ]
-
-    return sum(map(len, processed_group_answers))
+    group_masks = (context or SolveContext()).group_masks
+    return sum(everyone.bit_count() for _, everyone in group_masks)
 
 
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
@@ -1,6 +1,11 @@
+from collections import defaultdict
+from functools import cached_property
+
+from disk_cache import cache_parsed_input
 from util import load_line_groups_from_file
 
 
+@cache_parsed_input("inputs/day_7.txt")
 def parse_input() -> dict[str, list[tuple[int, str]]]:
     """Returns a dict of {color: color_contents} like:
     {
@@ -37,48 +42,63 @@ def parse_input() -> dict[str, list[tuple[int, str]]]:
     return result
 
 
-def part_1() -> int:
-    # You have a shiny gold bag. If you wanted to carry it in at least one other
-    # bag, how many different bag colors would be valid for the outermost bag?
-    # (In other words: how many colors can, eventually, contain at least one shiny gold bag?)
-    bag_rules = parse_input()
+class SolveContext:
+    """The bag rules, plus an index of which colors directly contain each color.
+
+    The index lets us walk the rules from the bottom up: rather than scanning every rule for bags
+    that contain a color, we can look them up directly.
+    """
+
+    @cached_property
+    def bag_rules(self) -> dict[str, list[tuple[int, str]]]:
+        return parse_input()
+
+    @cached_property
+    def colors_directly_containing(self) -> dict[str, set[str]]:
+        result = defaultdict(set)
+        for color, contents in self.bag_rules.items():
+            for _, contained_color in contents:
+                result[contained_color].add(color)
+
+        return dict(result)
+
 
-    colors_to_look_for = {"shiny gold"}
-    colors_known_to_contain_shiny_gold = set()
-    colors_to_check = set(bag_rules.keys()) - {"shiny gold"}
+def count_colors_that_can_contain(context: SolveContext, color: str) -> int:
+    colors_to_look_for = {color}
+    colors_known_to_contain_color = set()
 
     while colors_to_look_for:
         # Pop off a color to look for, like "shiny gold".
         color_to_look_for = colors_to_look_for.pop()
 
-        bags_that_contain_the_color = set(
-            color_to_check
-            for color_to_check in colors_to_check
-            if any(
-                bag_name == color_to_look_for
-                for _, bag_name in bag_rules[color_to_check]
-            )
+        # These colors of bags all directly contain that color, which means that they can all
+        # eventually contain `color`!
+        bags_that_contain_the_color = (
+            context.colors_directly_containing.get(color_to_look_for, set())
+            - colors_known_to_contain_color
         )
-
-        # At this point we've found all of the colors of bags that directly contain that color.
-        # This means that those colors of bags can all eventually contain shiny gold bags!
-        colors_known_to_contain_shiny_gold |= bags_that_contain_the_color
+        colors_known_to_contain_color |= bags_that_contain_the_color
         colors_to_look_for |= bags_that_contain_the_color
-        colors_to_check -= bags_that_contain_the_color
 
-    return len(colors_known_to_contain_shiny_gold)
+    return len(colors_known_to_contain_color)
 
 
-def part_2() -> int:
-    # How many individual bags are required inside your single shiny gold bag?
-    bag_rules = parse_input()
+def part_1(context: SolveContext | None = None, color: str = "shiny gold") -> int:
+    # You have a shiny gold bag. If you wanted to carry it in at least one other
+    # bag, how many different bag colors would be valid for the outermost bag?
+    # (In other words: how many colors can, eventually, contain at least one shiny gold bag?)
+    return count_colors_that_can_contain(context or SolveContext(), color)
+
+
+def count_bags_inside(context: SolveContext, color: str) -> int:
+    bag_rules = context.bag_rules
 
     # "So, a single shiny gold bag must contain 1 dark olive bag (and the 7 bags
     # within it) plus 2 vibrant plum bags (and the 11 bags within **each** of
     # those): 1 + 1*7 + 2 + 2*11 = 32 bags!"
     #
     # The "each" there is important, so our `colors_to_check` worklist tracks tuples of (multiplier, color).
-    colors_to_check = {(1, "shiny gold")}
+    colors_to_check = {(1, color)}
     num_bags_required = 0
 
     while colors_to_check:
@@ -94,6 +114,12 @@ def part_2() -> int:
     return num_bags_required
 
 
+def part_2(context: SolveContext | None = None, color: str = "shiny gold") -> int:
+    # How many individual bags are required inside your single shiny gold bag?
+    return count_bags_inside(context or SolveContext(), color)
+
+
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
@@ -1,6 +1,9 @@
+from disk_cache import cache_parsed_input
+
 Instruction = tuple[str, int]
 
 
+@cache_parsed_input("inputs/day_8.txt")
 def load_input() -> list[Instruction]:
     with open("inputs/day_8.txt") as f:
         lines = [line.strip().split(" ") for line in f]
@@ -1,7 +1,11 @@
 import collections
 import itertools
+from functools import cached_property
 
+from disk_cache import cache_parsed_input
 
+
+@cache_parsed_input("inputs/day_9.txt")
 def load_input() -> list[int]:
     with open("inputs/day_9.txt") as f:
         return [int(line.strip()) for line in f]
@@ -18,12 +22,7 @@ def can_number_be_constructed_from_any_pair_of_numbers(
     return False
 
 
-def part_1() -> int:
-    # The first step of attacking the weakness in the XMAS data is to find the
-    # first number in the list (after the preamble) which is not the sum of two
-    # of the 25 numbers before it. What is the first number that does not have
-    # this property?
-    xmas_data = load_input()
+def find_first_invalid_number(xmas_data: list[int]) -> int:
     previous_25_numbers = collections.deque(xmas_data[:25])
     for number in xmas_data[25:]:
         if not can_number_be_constructed_from_any_pair_of_numbers(
@@ -37,13 +36,34 @@ def part_1() -> int:
     return -1
 
 
-def part_2() -> int:
+class SolveContext:
+    """part_2 needs both the XMAS data and part_1's answer, so they're computed once and kept here."""
+
+    @cached_property
+    def xmas_data(self) -> list[int]:
+        return load_input()
+
+    @cached_property
+    def invalid_number(self) -> int:
+        return find_first_invalid_number(self.xmas_data)
+
+
+def part_1(context: SolveContext | None = None) -> int:
+    # The first step of attacking the weakness in the XMAS data is to find the
+    # first number in the list (after the preamble) which is not the sum of two
+    # of the 25 numbers before it. What is the first number that does not have
+    # this property?
+    return (context or SolveContext()).invalid_number
+
+
+def part_2(context: SolveContext | None = None) -> int:
     # The final step in breaking the XMAS encryption relies on the invalid
     # number you just found: you must find a contiguous set of at least two
     # numbers in your list which sum to the invalid number from step 1.
-    target_number = part_1()
+    context = context or SolveContext()
+    target_number = context.invalid_number
 
-    xmas_data = load_input()
+    xmas_data = context.xmas_data
     for i in range(len(xmas_data)):
         for j in range(len(xmas_data) - i):
             contiguous_numbers = xmas_data[i : i + j]
@@ -54,5 +74,6 @@ def part_2() -> int:
 
 
 if __name__ == "__main__":
-    print(part_1())
-    print(part_2())
+    context = SolveContext()
+    print(part_1(context))
+    print(part_2(context))
@@ -0,0 +1,290 @@
+import collections
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+CACHE_DIRECTORY = ".cache"
+
+# Set this environment variable to anything non-empty to skip the parsed-input cache entirely,
+# e.g. when you're benchmarking the parsers themselves.
+DISABLE_INPUT_CACHE_ENV_VAR = "ADVENT_NO_INPUT_CACHE"
+
+# Likewise for the answer cache, which would otherwise make every run after the first one instant.
+DISABLE_ANSWER_CACHE_ENV_VAR = "ADVENT_NO_ANSWER_CACHE"
+
+
+class DiskCache:
+    """A directory of pickled values, keyed by strings.
+
+    Each entry's mtime doubles as its last-used time, so that when the directory grows past
+    `max_bytes`, the least recently used entries can be evicted first.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = collections.Counter()
+
+    def path_for_key(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self.path_for_key(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.stats["misses"] += 1
+            return default
+
+        # Mark the entry as recently used, unless another process has just evicted it.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.stats["hits"] += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for_key(key)
+
+        # Write to a temporary file first so that a concurrent reader never sees half an entry.
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_bytes = f.tell()
+
+        # An entry that could never fit would otherwise evict everything else, and then itself.
+        if entry_bytes > self.max_bytes:
+            os.remove(temporary_path)
+            self.stats["too_large"] += 1
+            return
+
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    def entries(self) -> list[os.DirEntry]:
+        """Returns this cache's entries, least recently used first."""
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".pickle")
+            ]
+        except FileNotFoundError:
+            return []
+
+        # Another process can evict entries between the scandir and the stats. DirEntry caches
+        # the result of stat(), so the entries that are left can be stat()ed again safely.
+        entries_with_mtimes = []
+        for entry in entries:
+            try:
+                entries_with_mtimes.append((entry.stat().st_mtime_ns, entry))
+            except FileNotFoundError:
+                continue
+
+        entries_with_mtimes.sort(key=lambda mtime_and_entry: mtime_and_entry[0])
+        return [entry for _, entry in entries_with_mtimes]
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+
+        for entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            entry_bytes = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+            total_bytes -= entry_bytes
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+
+INPUT_CACHE = DiskCache(os.path.join(CACHE_DIRECTORY, "inputs"), max_bytes=256 * 2**20)
+
+
+def file_digest(filename: str) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def local_dependencies(filename: str) -> list[str]:
+    """Returns `filename` and the filenames of every module in its directory that it imports,
+    directly or indirectly."""
+    # Imported here for the same reason as argparse in main().
+    import ast
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    dependencies = []
+    to_visit = [os.path.abspath(filename)]
+
+    while to_visit:
+        path = to_visit.pop()
+        if path in dependencies:
+            continue
+        dependencies.append(path)
+
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                module_names = [node.module]
+            else:
+                continue
+
+            for module_name in module_names:
+                module_path = os.path.join(directory, f"{module_name}.py")
+                if os.path.exists(module_path):
+                    to_visit.append(module_path)
+
+    return sorted(dependencies)
+
+
+def cache_parsed_input(filename: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorates a function that parses `filename`, like a `load_input` or `parse_input` function.
+
+    The decorated function's result is pickled into INPUT_CACHE, so that later calls (including ones
+    in later runs of the program) can skip parsing entirely. Entries are keyed on the input file's
+    path, size, mtime and contents, as well as the source of the module that does the parsing and of
+    every module it imports from this repo (like util), so editing either the input file or the
+    parser invalidates them.
+    """
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        module_filename = sys.modules[fn.__module__].__file__
+        # Found on the first call rather than here, since this runs at import time.
+        dependencies = []
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> T:
+            if os.environ.get(DISABLE_INPUT_CACHE_ENV_VAR):
+                return fn(*args, **kwargs)
+
+            if not dependencies:
+                dependencies.extend(local_dependencies(module_filename))
+
+            input_stat = os.stat(filename)
+            key = hashlib.sha256(
+                repr(
+                    (
+                        fn.__module__,
+                        fn.__qualname__,
+                        os.path.abspath(filename),
+                        input_stat.st_size,
+                        input_stat.st_mtime_ns,
+                        file_digest(filename),
+                        [file_digest(path) for path in dependencies],
+                        args,
+                        kwargs,
+                    )
+                ).encode()
+            ).hexdigest()
+
+            missing = object()
+            result = INPUT_CACHE.get(key, missing)
+            if result is missing:
+                result = fn(*args, **kwargs)
+                INPUT_CACHE.put(key, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+ANSWER_CACHE = DiskCache(os.path.join(CACHE_DIRECTORY, "answers"), max_bytes=16 * 2**20)
+
+
+def input_filename_for(module: ModuleType) -> str:
+    """Returns the absolute path of the input file that `module` reads. Solvers open
+    inputs/day_N.txt relative to the working directory, not to their own directory, so this does
+    too."""
+    return os.path.abspath(os.path.join("inputs", f"{module.__name__}.txt"))
+
+
+def answer_cache_key(module: ModuleType, part_name: str) -> str:
+    """Hashes everything that a part's answer depends on: the source of its module and of the
+    modules that that one imports from this repo, and the module's input file, if it has one.
+    """
+    digests = [
+        (os.path.basename(path), file_digest(path))
+        for path in local_dependencies(module.__file__)
+    ]
+
+    input_filename = input_filename_for(module)
+    if os.path.exists(input_filename):
+        digests.append((input_filename, file_digest(input_filename)))
+
+    return hashlib.sha256(
+        repr((module.__name__, part_name, digests)).encode()
+    ).hexdigest()
+
+
+def cached_answer(module: ModuleType, part_name: str, solve: Callable[[], T]) -> T:
+    """Returns the answer to `module`'s `part_name` from ANSWER_CACHE, or calls `solve` to compute
+    it if it isn't there.
+
+    Entries are keyed on the contents of every file the answer could depend on (see
+    answer_cache_key), so editing a solver, anything it imports or its input invalidates exactly
+    the answers that depend on them.
+    """
+    if os.environ.get(DISABLE_ANSWER_CACHE_ENV_VAR):
+        return solve()
+
+    key = answer_cache_key(module, part_name)
+    missing = object()
+    answer = ANSWER_CACHE.get(key, missing)
+    if answer is missing:
+        answer = solve()
+        ANSWER_CACHE.put(key, answer)
+
+    return answer
+
+
+def main() -> None:
+    # Imported here rather than at the top, because every day module imports this one and
+    # argparse is comparatively slow to import.
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["stats", "clear"])
+    args = parser.parse_args()
+
+    for name, cache in (("inputs", INPUT_CACHE), ("answers", ANSWER_CACHE)):
+        if args.command == "clear":
+            cache.clear()
+            continue
+
+        entries = cache.entries()
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        print(
+            f"{name}: {len(entries)} entries, {total_bytes / 2**20:.1f} MiB "
+            f"of {cache.max_bytes / 2**20:.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Answers day 1's question (which entries add up to a target?) for many targets at once.
+
+ExpenseIndex is built once from a list of expense report entries, and then finds a pair or triple
+of entries for every target in a batch using numpy, rather than searching for each target in turn:
+
+    python expense_index.py 2020 2021 2022 --triples
+
+numpy isn't needed by anything else in this repo, which is why this lives outside of day_1.py.
+"""
+
+import argparse
+from typing import Iterable
+
+import numpy as np
+
+from day_1 import load_input
+
+# Above this many distinct possible values, a presence map would take up too much memory, so we
+# binary search the sorted array of values instead.
+MAX_PRESENCE_MAP_SIZE = 2**24
+
+# How many (target, candidate) pairs to check at once; bigger batches are split up so that the
+# intermediate arrays stay a few tens of MiB at most.
+MAX_BATCH_ELEMENTS = 2**20
+
+
+class ExpenseIndex:
+    def __init__(self, numbers: Iterable[int]):
+        values, counts = np.unique(
+            np.fromiter(numbers, dtype=np.int64), return_counts=True
+        )
+
+        # The distinct entries in ascending order, and how many times each one appears (capped at
+        # 3, since no match uses one value more than 3 times).
+        self.values = values
+        self.counts = np.minimum(counts, 3).astype(np.uint8)
+
+        self.presence_map = None
+        if len(values) and values[-1] - values[0] < MAX_PRESENCE_MAP_SIZE:
+            self.presence_map = np.zeros(values[-1] - values[0] + 1, dtype=np.uint8)
+            self.presence_map[values - values[0]] = self.counts
+
+    def count_of(self, numbers: np.ndarray) -> np.ndarray:
+        """Returns how many times each of `numbers` appears in the index, up to 3."""
+        if not len(self.values):
+            return np.zeros(numbers.shape, dtype=np.uint8)
+
+        low, high = self.values[0], self.values[-1]
+        in_range = (numbers >= low) & (numbers <= high)
+
+        if self.presence_map is not None:
+            offsets = np.clip(numbers - low, 0, len(self.presence_map) - 1)
+            return np.where(in_range, self.presence_map[offsets], 0)
+
+        positions = np.clip(
+            np.searchsorted(self.values, numbers), 0, len(self.values) - 1
+        )
+        found = in_range & (self.values[positions] == numbers)
+        return np.where(found, self.counts[positions], 0)
+
+    def first_matches(
+        self, remainders: np.ndarray, start: int, smallest: int | None = None
+    ) -> np.ndarray:
+        """For each of `remainders`, finds the first index j >= `start` such that values[j] and
+        some c >= values[j] add up to that remainder, and returns those indexes (or -1 where there
+        isn't one).
+
+        If `smallest` is given, it's a value that the match has already used once, so values[j]
+        and c need to appear an extra time if they're equal to it.
+        """
+        candidates = self.values[start:]
+        candidate_counts = self.counts[start:].astype(np.int64)
+        if smallest is not None:
+            candidate_counts -= candidates == smallest
+
+        matches = np.full(len(remainders), -1, dtype=np.int64)
+        if not len(candidates):
+            return matches
+
+        batch_size = max(1, MAX_BATCH_ELEMENTS // len(candidates))
+        for batch_start in range(0, len(remainders), batch_size):
+            batch = remainders[batch_start : batch_start + batch_size, np.newaxis]
+            complements = batch - candidates
+            required_counts = 1 + (complements == candidates)
+            if smallest is not None:
+                required_counts += complements == smallest
+
+            valid = (
+                (complements >= candidates)
+                & (candidate_counts >= 1)
+                & (self.count_of(complements) >= required_counts)
+            )
+            found = valid.any(axis=1)
+            matches[batch_start : batch_start + batch_size] = np.where(
+                found, valid.argmax(axis=1) + start, -1
+            )
+
+        return matches
+
+    def find_pairs(self, targets: Iterable[int]) -> list[tuple[int, int] | None]:
+        """Returns, for each target, the pair of entries that adds up to it with the smallest first
+        entry, or None if no pair does."""
+        targets = np.fromiter(targets, dtype=np.int64)
+        matches = self.first_matches(targets, 0)
+
+        return [
+            (int(self.values[j]), int(target - self.values[j])) if j >= 0 else None
+            for target, j in zip(targets, matches)
+        ]
+
+    def find_triples(self, targets: Iterable[int]) -> list[tuple[int, int, int] | None]:
+        """Returns, for each target, the lexicographically smallest triple of entries (each triple
+        in ascending order) that adds up to it, or None if no triple does."""
+        targets = np.fromiter(targets, dtype=np.int64)
+        results = [None] * len(targets)
+        unresolved = np.arange(len(targets))
+
+        # Try each possible smallest entry in turn, checking every target that hasn't found a match
+        # yet at once.
+        for i, smallest in enumerate(self.values):
+            # The other two entries are at least as big as this one, so targets smaller than three
+            # times it can't be reached from here on.
+            unresolved = unresolved[targets[unresolved] >= 3 * smallest]
+            if not len(unresolved):
+                break
+
+            remainders = targets[unresolved] - smallest
+            matches = self.first_matches(remainders, i, smallest)
+
+            for target_index, remainder, j in zip(unresolved, remainders, matches):
+                if j >= 0:
+                    middle = self.values[j]
+                    results[target_index] = (
+                        int(smallest),
+                        int(middle),
+                        int(remainder - middle),
+                    )
+            unresolved = unresolved[matches < 0]
+
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("targets", type=int, nargs="+")
+    parser.add_argument(
+        "--triples", action="store_true", help="Find triples instead of pairs."
+    )
+    args = parser.parse_args()
+
+    index = ExpenseIndex(int(line) for line in load_input("day_1.txt"))
+    find = index.find_triples if args.triples else index.find_pairs
+    for target, match in zip(args.targets, find(args.targets)):
+        print(target, match)
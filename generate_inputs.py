@@ -0,0 +1,784 @@
+"""Generates synthetic, solvable puzzle inputs of arbitrary size, for load-testing the solvers.
+
+Every solver reads its input from the relative path `inputs/day_N.txt`, so generated inputs are
+written to `<output directory>/inputs/day_N.txt`, and can be solved by running the solvers from
+inside the output directory, e.g.:
+
+    python generate_inputs.py --scale 100 --output scaled/x100
+    cd scaled/x100 && python ../../bench.py --days 1 9 22
+
+The same seed always generates the same inputs.
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import string
+from typing import Callable, Iterator
+
+from day_11 import GridValue, SeatGrid, WhichNeighborAlgorithmToUse
+from day_20 import SEA_MONSTER_COORDINATES, flip_image, rotate_image_right
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[int, Generator] = {}
+
+# Roughly the size of each of our real inputs, in whatever unit each generator's `size` is in.
+DEFAULT_SIZES = {
+    1: 200,
+    2: 1000,
+    3: 323,
+    4: 250,
+    5: 900,
+    6: 450,
+    7: 600,
+    8: 600,
+    9: 1000,
+    10: 100,
+    11: 98,
+    12: 800,
+    13: 9,
+    14: 100,
+    16: 240,
+    17: 8,
+    18: 370,
+    19: 480,
+    20: 144,
+    21: 40,
+    22: 25,
+}
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    def decorator(fn: Generator) -> Generator:
+        GENERATORS[day] = fn
+        return fn
+
+    return decorator
+
+
+def random_words(count: int, rng: random.Random, length: int = 6) -> list[str]:
+    words = set()
+    while len(words) < count:
+        words.add(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, length)))
+        )
+
+    return sorted(words)
+
+
+def primes() -> Iterator[int]:
+    for candidate in itertools.count(2):
+        if all(candidate % i != 0 for i in range(2, math.isqrt(candidate) + 1)):
+            yield candidate
+
+
+# Expense report entries. Filler entries are all more than 1010, so no two or three of them can
+# sum to 2020; exactly one planted pair and one planted triple do.
+@generator(1)
+def generate_day_1(size: int, rng: random.Random) -> str:
+    pair = [rng.randint(1, 1009)]
+    pair.append(2020 - pair[0])
+    triple = [rng.randint(1, 673), rng.randint(1, 673)]
+    triple.append(2020 - sum(triple))
+    planted = pair + triple
+
+    # Make sure that filler entries can't complete a sum with one or two of the planted entries.
+    forbidden = {2020 - a for a in planted} | {
+        2020 - a - b for a, b in itertools.combinations(planted, 2)
+    }
+    fillers = [n for n in range(1011, 2020) if n not in forbidden]
+
+    numbers = planted + rng.choices(fillers, k=max(0, size - len(planted)))
+    rng.shuffle(numbers)
+    return "\n".join(map(str, numbers)) + "\n"
+
+
+# Password policies, like "1-3 a: abcde".
+@generator(2)
+def generate_day_2(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        char = rng.choice(string.ascii_lowercase)
+        password_length = rng.randint(4, 20)
+        low = rng.randint(1, password_length - 1)
+        high = rng.randint(low + 1, password_length)
+
+        # Bias passwords towards containing the policy's character, so that some are valid.
+        password = "".join(
+            char if rng.random() < 0.3 else rng.choice(string.ascii_lowercase)
+            for _ in range(password_length)
+        )
+        lines.append(f"{low}-{high} {char}: {password}")
+
+    return "\n".join(lines) + "\n"
+
+
+# A map of open squares (.) and trees (#), 31 columns wide and `size` rows tall.
+@generator(3)
+def generate_day_3(size: int, rng: random.Random, width: int = 31) -> str:
+    return "".join(
+        "".join("#" if rng.random() < 0.25 else "." for _ in range(width)) + "\n"
+        for _ in range(size)
+    )
+
+
+# Passports, some of which are missing fields or have invalid values.
+@generator(4)
+def generate_day_4(size: int, rng: random.Random) -> str:
+    def field_value(field: str, valid: bool) -> str:
+        match field, valid:
+            case "byr", True:
+                return str(rng.randint(1920, 2002))
+            case "iyr", True:
+                return str(rng.randint(2010, 2020))
+            case "eyr", True:
+                return str(rng.randint(2020, 2030))
+            case "hgt", True:
+                if rng.random() < 0.5:
+                    return f"{rng.randint(150, 193)}cm"
+                return f"{rng.randint(59, 76)}in"
+            case "hcl", True:
+                return "#" + "".join(rng.choices("0123456789abcdef", k=6))
+            case "ecl", True:
+                return rng.choice(["amb", "blu", "brn", "gry", "grn", "hzl", "oth"])
+            case "pid", True:
+                return "".join(rng.choices(string.digits, k=9))
+            case "cid", _:
+                return str(rng.randint(1, 350))
+            case "byr" | "iyr" | "eyr", False:
+                return str(rng.randint(1900, 2050))
+            case "hgt", False:
+                return str(rng.randint(50, 200)) + rng.choice(["cm", "in", ""])
+            case "hcl", False:
+                return "".join(rng.choices("0123456789abcdef", k=6))
+            case "ecl", False:
+                return rng.choice(
+                    ["#" + "".join(rng.choices("0123456789abcdef", k=6)), "xry"]
+                )
+            case "pid", False:
+                return "".join(rng.choices(string.digits, k=rng.choice([8, 10])))
+
+    all_fields = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid"]
+    groups = []
+    for _ in range(size):
+        fields = [field for field in all_fields if rng.random() < 0.93] or ["cid"]
+        rng.shuffle(fields)
+        items = [
+            f"{field}:{field_value(field, rng.random() < 0.9)}" for field in fields
+        ]
+
+        # Passport fields are spread over a few lines.
+        num_lines = rng.randint(1, min(3, len(items)))
+        line_breaks = sorted(rng.sample(range(1, len(items)), num_lines - 1))
+        groups.append(
+            "\n".join(
+                " ".join(items[start:end])
+                for start, end in itertools.pairwise([0, *line_breaks, len(items)])
+            )
+        )
+
+    return "\n\n".join(groups) + "\n"
+
+
+# Boarding passes for a plane with 128 rows of 8 seats. A contiguous block of `size` seats is
+# taken (at most the whole plane), minus one seat in the middle, which is yours.
+@generator(5)
+def generate_day_5(size: int, rng: random.Random) -> str:
+    num_seats = 128 * 8
+    # There have to be seats on both sides of yours.
+    size = max(2, min(size, num_seats - 2))
+    first_seat = rng.randint(1, num_seats - size - 1)
+    seats = list(range(first_seat, first_seat + size + 1))
+    seats.remove(rng.choice(seats[1:-1]))
+    rng.shuffle(seats)
+
+    def encode(seat_id: int) -> str:
+        bits = format(seat_id, "010b")
+        return bits[:7].replace("0", "F").replace("1", "B") + bits[7:].replace(
+            "0", "L"
+        ).replace("1", "R")
+
+    return "\n".join(map(encode, seats)) + "\n"
+
+
+# Groups of customs declaration answers.
+@generator(6)
+def generate_day_6(size: int, rng: random.Random) -> str:
+    groups = []
+    for _ in range(size):
+        # Members of a group tend to share some answers, so that part 2 isn't always zero.
+        shared = rng.sample(string.ascii_lowercase, rng.randint(0, 8))
+        members = [
+            "".join(
+                sorted(
+                    set(shared)
+                    | set(rng.sample(string.ascii_lowercase, rng.randint(0, 8)))
+                )
+            )
+            or "a"
+            for _ in range(rng.randint(1, 5))
+        ]
+        groups.append("\n".join(members))
+
+    return "\n\n".join(groups) + "\n"
+
+
+# Bag rules, forming a DAG `depth` layers deep with shiny gold in the middle layer. Each bag
+# contains bags from the next layer down, so the graph can't have cycles.
+@generator(7)
+def generate_day_7(size: int, rng: random.Random, depth: int = 8) -> str:
+    num_words = math.isqrt(size) + 2
+    adjectives = random_words(num_words, rng)
+    colors = random_words(num_words, rng)
+    names = [f"{adjective} {color}" for adjective in adjectives for color in colors]
+    names = [name for name in rng.sample(names, size) if name != "shiny gold"]
+    names[0] = "shiny gold"
+    rng.shuffle(names)
+
+    layers = [names[i::depth] for i in range(depth)]
+    if "shiny gold" not in layers[depth // 2]:
+        layer = next(layer for layer in layers if "shiny gold" in layer)
+        layer.remove("shiny gold")
+        layers[depth // 2].append("shiny gold")
+
+    lines = []
+    for layer, next_layer in itertools.zip_longest(layers, layers[1:], fillvalue=[]):
+        for name in layer:
+            if not next_layer:
+                lines.append(f"{name} bags contain no other bags.")
+                continue
+
+            contents = [
+                f"{count} {color} bag{'s' if count > 1 else ''}"
+                for color in rng.sample(
+                    next_layer, min(len(next_layer), rng.randint(1, 3))
+                )
+                for count in [rng.randint(1, 5)]
+            ]
+            lines.append(f"{name} bags contain {', '.join(contents)}.")
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+# A boot program with an infinite loop, which is fixed by switching exactly one instruction: the
+# final jmp, which jumps back into the middle of the program.
+@generator(8)
+def generate_day_8(size: int, rng: random.Random) -> str:
+    size = max(size, 3)
+    instructions = []
+    for i in range(size - 1):
+        kind = rng.choices(["acc", "jmp", "nop"], weights=[5, 2, 2])[0]
+        if kind == "acc":
+            instructions.append(f"acc {rng.randint(-50, 50):+d}")
+        else:
+            # Forward jumps (or nops that would be forward jumps) that land inside the program,
+            # so that switching them can never make the program terminate.
+            instructions.append(
+                f"{kind} {rng.randint(1, max(1, min(10, size - 2 - i))):+d}"
+            )
+
+    # Jumping back to instruction 0 wouldn't be caught as a loop by day_8, which only
+    # remembers instructions it's moved to.
+    loop_target = rng.randint(1, size - 2)
+    instructions.append(f"jmp {loop_target - (size - 1):+d}")
+
+    return "\n".join(instructions) + "\n"
+
+
+# XMAS data: after a 25-number preamble, every number is the sum of two of the 25 before it,
+# except for the last number, which is instead the sum of a contiguous run of earlier numbers.
+#
+# If every number were a sum of two positive numbers, they'd double every 25 numbers or so, so a
+# couple of zeroes are kept cycling through the window: 0 = 0 + 0, and x = x + 0.
+@generator(9)
+def generate_day_9(size: int, rng: random.Random, limit: int = 10**9) -> str:
+    preamble_length = 25
+    numbers = rng.sample(range(1, 10**6), preamble_length - 2) + [0, 0]
+    rng.shuffle(numbers)
+
+    while len(numbers) < size - 1:
+        window = numbers[-preamble_length:]
+        if window[0] == 0:
+            numbers.append(0)
+            continue
+
+        for _ in range(10):
+            a, b = rng.sample(window, 2)
+            if 0 < a + b <= limit:
+                numbers.append(a + b)
+                break
+        else:
+            numbers.append(window[0])
+
+    window = numbers[-preamble_length:]
+    pair_sums = {a + b for a, b in itertools.combinations(window, 2)}
+    while True:
+        start = rng.randrange(len(numbers) - 2)
+        run = numbers[start : start + rng.randint(2, 17)]
+        if len(run) >= 2 and sum(run) not in pair_sums:
+            numbers.append(sum(run))
+            break
+
+    return "\n".join(map(str, numbers)) + "\n"
+
+
+# Adapter joltages, each 1 or 3 jolts apart from the next one.
+@generator(10)
+def generate_day_10(size: int, rng: random.Random) -> str:
+    joltages = list(itertools.accumulate(rng.choices([1, 3], weights=[2, 1], k=size)))
+    rng.shuffle(joltages)
+    return "\n".join(map(str, joltages)) + "\n"
+
+
+# A seat layout of empty seats (L) and floor (.), 92 columns wide and `size` rows tall.
+@generator(11)
+def generate_day_11(size: int, rng: random.Random, width: int = 92) -> str:
+    # Crowded grids tend to end up flipping between two states forever instead of settling, so
+    # seats are a bit sparser than they'd otherwise be, and grids that still don't settle under
+    # both parts' rules are thrown away.
+    while True:
+        lines = [
+            "".join("L" if rng.random() < 0.7 else "." for _ in range(width))
+            for _ in range(size)
+        ]
+        grid = SeatGrid(
+            seats=tuple(GridValue(char) for char in "".join(lines)),
+            width=width,
+            height=size,
+        )
+        if seat_grid_settles(
+            grid, 4, WhichNeighborAlgorithmToUse.IMMEDIATELY_ADJACENT
+        ) and seat_grid_settles(grid, 5, WhichNeighborAlgorithmToUse.LINE_OF_SIGHT):
+            return "".join(line + "\n" for line in lines)
+
+
+def seat_grid_settles(
+    grid: SeatGrid,
+    min_occupied_seats_for_occupied_seat_to_become_empty: int,
+    neighbor_algorithm: WhichNeighborAlgorithmToUse,
+) -> bool:
+    previous_grid = None
+    # Grids that don't settle flip between two states, but give up eventually either way.
+    for _ in range(len(grid.seats) + 1):
+        next_grid = grid.one_round_later(
+            min_occupied_seats_for_occupied_seat_to_become_empty, neighbor_algorithm
+        )
+        if next_grid == grid:
+            return True
+        if next_grid == previous_grid:
+            return False
+        previous_grid, grid = grid, next_grid
+
+    return False
+
+
+# Navigation instructions.
+@generator(12)
+def generate_day_12(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        action = rng.choices("NSEWLRF", weights=[1, 1, 1, 1, 1, 1, 2])[0]
+        if action in "LR":
+            lines.append(f"{action}{rng.choice([90, 180, 270])}")
+        else:
+            lines.append(f"{action}{rng.randint(1, 99)}")
+
+    return "\n".join(lines) + "\n"
+
+
+# A departure timestamp and `size` buses. Bus IDs are distinct primes, so that part 2's Chinese
+# remainder theorem has a solution.
+@generator(13)
+def generate_day_13(size: int, rng: random.Random) -> str:
+    bus_ids = list(itertools.islice(primes(), 5, 5 + size))
+    rng.shuffle(bus_ids)
+
+    schedule = []
+    for bus_id in bus_ids:
+        schedule.extend(["x"] * rng.randint(0, 10))
+        schedule.append(str(bus_id))
+
+    return f"{rng.randint(10**5, 10**7)}\n{','.join(schedule)}\n"
+
+
+# A docking program of `size` masks, each followed by a few writes. Masks have at most 9 floating
+# bits, like ours, so that part 2 writes to at most 512 addresses per write.
+@generator(14)
+def generate_day_14(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        mask = rng.choices("01", k=36)
+        for i in rng.sample(range(36), rng.randint(1, 9)):
+            mask[i] = "X"
+        lines.append(f"mask = {''.join(mask)}")
+
+        for _ in range(rng.randint(1, 6)):
+            lines.append(f"mem[{rng.randint(0, 65535)}] = {rng.randint(0, 10**9)}")
+
+    return "\n".join(lines) + "\n"
+
+
+TICKET_FIELD_NAMES = [
+    "departure location",
+    "departure station",
+    "departure platform",
+    "departure track",
+    "departure date",
+    "departure time",
+    "arrival location",
+    "arrival station",
+    "arrival platform",
+    "arrival track",
+    "class",
+    "duration",
+    "price",
+    "route",
+    "row",
+    "seat",
+    "train",
+    "type",
+    "wagon",
+    "zone",
+]
+
+
+# Ticket rules, your ticket, and `size` nearby tickets. day_16 expects exactly 20 fields.
+#
+# Field k accepts values up to 100 * (k + 1), except for one gap value, and the column for field k
+# always has a value above 100 * k. So column k could be any of fields k..19, and part 2's process
+# of elimination resolves the columns from the last field down to the first.
+@generator(16)
+def generate_day_16(size: int, rng: random.Random) -> str:
+    num_fields = len(TICKET_FIELD_NAMES)
+    highs = [100 * (k + 1) for k in range(num_fields)]
+    gaps = [rng.randint(high - 98, high - 2) for high in highs]
+    valid_values = set(range(1, highs[-1] + 1)) - set(gaps)
+    field_names = rng.sample(TICKET_FIELD_NAMES, num_fields)
+    column_order = rng.sample(range(num_fields), num_fields)
+
+    def random_ticket(force_high_values: bool = False) -> list[int]:
+        by_field = []
+        for k, high in enumerate(highs):
+            low = high - 99 if force_high_values else 1
+            value = rng.randint(low, high)
+            while value not in valid_values:
+                value = rng.randint(low, high)
+            by_field.append(value)
+
+        return [by_field[k] for k in column_order]
+
+    nearby_tickets = [random_ticket(force_high_values=True)]
+    while len(nearby_tickets) < size:
+        ticket = random_ticket()
+        if rng.random() < 0.25:
+            ticket[rng.randrange(num_fields)] = rng.randint(
+                highs[-1] + 1, highs[-1] + 999
+            )
+        nearby_tickets.append(ticket)
+    rng.shuffle(nearby_tickets)
+
+    lines = [
+        f"{name}: 1-{gap - 1} or {gap + 1}-{high}"
+        for name, gap, high in zip(field_names, gaps, highs)
+    ]
+    rng.shuffle(lines)
+    lines += [
+        "",
+        "your ticket:",
+        ",".join(map(str, random_ticket())),
+        "",
+        "nearby tickets:",
+    ]
+    lines += [",".join(map(str, ticket)) for ticket in nearby_tickets]
+
+    return "\n".join(lines) + "\n"
+
+
+# A `size` x `size` starting slice of the Conway Cubes pocket dimension.
+@generator(17)
+def generate_day_17(size: int, rng: random.Random) -> str:
+    return "".join(
+        "".join(rng.choice("#.") for _ in range(size)) + "\n" for _ in range(size)
+    )
+
+
+# Math homework: expressions made of single digits, +, * and parentheses.
+@generator(18)
+def generate_day_18(size: int, rng: random.Random, max_depth: int = 3) -> str:
+    def expression(depth: int) -> str:
+        terms = []
+        for _ in range(rng.randint(2, 5)):
+            if depth < max_depth and rng.random() < 0.25:
+                terms.append(f"({expression(depth + 1)})")
+            else:
+                terms.append(str(rng.randint(1, 9)))
+
+        result = terms[0]
+        for term in terms[1:]:
+            result += f" {rng.choice('+*')} {term}"
+
+        return result
+
+    return "\n".join(expression(0) for _ in range(size)) + "\n"
+
+
+# Message rules and `size` messages. Like ours, the rules are 0: 8 11, 8: 42 and 11: 42 31, and
+# rules 42 and 31 each match a different half of all of the 8-character strings of a's and b's.
+@generator(19)
+def generate_day_19(size: int, rng: random.Random) -> str:
+    all_chunks = ["".join(chars) for chars in itertools.product("ab", repeat=8)]
+    rule_42_chunks = set(rng.sample(all_chunks, len(all_chunks) // 2))
+    rule_31_chunks = set(all_chunks) - rule_42_chunks
+
+    rule_numbers = iter(
+        rng.sample(
+            [number for number in range(12, 1000) if number not in (31, 42)], 900
+        )
+    )
+    leaf_numbers = {"a": str(next(rule_numbers)), "b": str(next(rule_numbers))}
+    rules = {number: f'"{char}"' for char, number in leaf_numbers.items()}
+    rule_numbers_by_chunk_set = {}
+
+    # Builds a rule matching exactly `chunks` (which all have the same length) by splitting them up
+    # on their first character, and returns its number.
+    def build_rule(chunks: frozenset[str], number: str | None = None) -> str:
+        if len(chunks) == 1 and len(next(iter(chunks))) == 1 and number is None:
+            return leaf_numbers[next(iter(chunks))]
+        if chunks in rule_numbers_by_chunk_set and number is None:
+            return rule_numbers_by_chunk_set[chunks]
+
+        alternatives = []
+        for char in "ab":
+            rests = frozenset(chunk[1:] for chunk in chunks if chunk[0] == char)
+            if not rests:
+                continue
+            if rests == {""}:
+                alternatives.append(leaf_numbers[char])
+            else:
+                alternatives.append(f"{leaf_numbers[char]} {build_rule(rests)}")
+
+        number = number or str(next(rule_numbers))
+        rules[number] = " | ".join(alternatives)
+        rule_numbers_by_chunk_set[chunks] = number
+        return number
+
+    build_rule(frozenset(rule_42_chunks), "42")
+    build_rule(frozenset(rule_31_chunks), "31")
+    rules["0"] = "8 11"
+    rules["8"] = "42"
+    rules["11"] = "42 31"
+
+    sorted_42 = sorted(rule_42_chunks)
+    sorted_31 = sorted(rule_31_chunks)
+    messages = []
+    for _ in range(size):
+        num_31 = rng.choice([1, 1, 2, 3])
+        num_42 = num_31 + rng.choice([1, 1, 2, 3])
+        message = "".join(
+            rng.choices(sorted_42, k=num_42) + rng.choices(sorted_31, k=num_31)
+        )
+        if rng.random() < 0.4:
+            # Most of these won't match any more.
+            message = "".join(rng.sample(message, len(message)))
+        messages.append(message)
+
+    rule_lines = [f"{number}: {value}" for number, value in rules.items()]
+    rng.shuffle(rule_lines)
+    return "\n".join(rule_lines) + "\n\n" + "\n".join(messages) + "\n"
+
+
+# `size` image tiles (rounded down to a square number), which fit together into a square image
+# containing a few sea monsters.
+#
+# Tiles are 10x10, so a border is one of 2^10 strings, and each border must match at most one other
+# border in either direction. That leaves 496 usable borders, fewer still once the corners that
+# borders share have been picked, so inputs are capped at 12x12 tiles, like ours.
+@generator(20)
+def generate_day_20(size: int, rng: random.Random) -> str:
+    side = math.isqrt(size)
+    if not 1 <= side <= 12:
+        raise ValueError(f"day 20 inputs can have between 1 and 144 tiles, not {size}")
+
+    # Neighboring tiles share their borders, so the tiles overlap on a grid that's 9 * side + 1
+    # characters wide.
+    grid_width = 9 * side + 1
+    grid = [["." for _ in range(grid_width)] for _ in range(grid_width)]
+
+    # First, the image itself: the 8x8 middle of each tile, with some sea monsters.
+    image_width = 8 * side
+    image = [
+        [rng.choice("#..") for _ in range(image_width)] for _ in range(image_width)
+    ]
+    for _ in range(side * side // 9 if image_width > 20 else 0):
+        x = rng.randrange(image_width - 20)
+        y = rng.randrange(image_width - 3)
+        for xx, yy in SEA_MONSTER_COORDINATES:
+            image[y + yy][x + xx] = "#"
+
+    for y in range(image_width):
+        for x in range(image_width):
+            grid[y // 8 * 9 + 1 + y % 8][x // 8 * 9 + 1 + x % 8] = image[y][x]
+
+    # Then the borders, starting with the corners that they share.
+    for y in range(0, grid_width, 9):
+        for x in range(0, grid_width, 9):
+            grid[y][x] = rng.choice("#.")
+
+    used_borders = set()
+
+    def fill_border(cells: list[tuple[int, int]]) -> None:
+        for _ in range(10_000):
+            middle = rng.choices("#.", k=8)
+            border = (
+                grid[cells[0][1]][cells[0][0]]
+                + "".join(middle)
+                + grid[cells[-1][1]][cells[-1][0]]
+            )
+            if border != border[::-1] and border not in used_borders:
+                break
+        else:
+            raise ValueError("ran out of distinct tile borders")
+
+        used_borders.add(border)
+        used_borders.add(border[::-1])
+        for (x, y), char in zip(cells[1:-1], middle):
+            grid[y][x] = char
+
+    for i in range(0, grid_width, 9):
+        for j in range(0, grid_width - 1, 9):
+            fill_border([(x, i) for x in range(j, j + 10)])
+            fill_border([(i, y) for y in range(j, j + 10)])
+
+    tile_ids = rng.sample(range(1000, 10000), side * side)
+    tiles = []
+    for tile_y in range(side):
+        for tile_x in range(side):
+            data = [
+                "".join(grid[tile_y * 9 + y][tile_x * 9 : tile_x * 9 + 10])
+                for y in range(10)
+            ]
+            for _ in range(rng.randrange(4)):
+                data = rotate_image_right(data)
+            if rng.random() < 0.5:
+                data = flip_image(data)
+
+            tiles.append(
+                f"Tile {tile_ids[tile_y * side + tile_x]}:\n" + "\n".join(data)
+            )
+
+    rng.shuffle(tiles)
+    return "\n\n".join(tiles) + "\n"
+
+
+ALLERGENS = [
+    "dairy",
+    "eggs",
+    "fish",
+    "nuts",
+    "peanuts",
+    "sesame",
+    "shellfish",
+    "soy",
+    "wheat",
+]
+
+
+# `size` foods. Each allergen is in exactly one ingredient, and every food that lists an allergen
+# contains that ingredient, so part 2's process of elimination can always pin them down.
+@generator(21)
+def generate_day_21(size: int, rng: random.Random) -> str:
+    # With only one food, nothing rules out any of its 10+ safe ingredients.
+    if size < 2:
+        raise ValueError(f"day 21 inputs need at least 2 foods, not {size}")
+
+    while True:
+        ingredients = random_words(200, rng, length=8)
+        allergens = rng.sample(ALLERGENS, min(8, max(1, size // 5)))
+        dangerous = dict(zip(allergens, rng.sample(ingredients, len(allergens))))
+        safe = [
+            ingredient
+            for ingredient in ingredients
+            if ingredient not in dangerous.values()
+        ]
+
+        foods = []
+        for _ in range(size):
+            listed = rng.sample(allergens, rng.randint(1, min(3, len(allergens))))
+            food_ingredients = set(rng.sample(safe, rng.randint(10, 40)))
+            food_ingredients |= {dangerous[allergen] for allergen in listed}
+            # Allergens aren't always marked.
+            food_ingredients |= {
+                ingredient for ingredient in dangerous.values() if rng.random() < 0.3
+            }
+            food_ingredients = sorted(food_ingredients)
+            rng.shuffle(food_ingredients)
+            foods.append((food_ingredients, listed))
+
+        # Make sure that the candidates can be resolved by process of elimination.
+        candidates = {
+            allergen: set.intersection(
+                *(
+                    set(ingredients)
+                    for ingredients, listed in foods
+                    if allergen in listed
+                )
+            )
+            for allergen in allergens
+            if any(allergen in listed for _, listed in foods)
+        }
+        while any(len(ingredients) == 1 for ingredients in candidates.values()):
+            allergen, ingredients = next(
+                (k, v) for k, v in candidates.items() if len(v) == 1
+            )
+            del candidates[allergen]
+            for other in candidates.values():
+                other -= ingredients
+
+        if not candidates:
+            return "".join(
+                f"{' '.join(ingredients)} (contains {', '.join(listed)})\n"
+                for ingredients, listed in foods
+            )
+
+
+# Two decks of `size` cards each, numbered 1 through 2 * size.
+@generator(22)
+def generate_day_22(size: int, rng: random.Random) -> str:
+    cards = rng.sample(range(1, 2 * size + 1), 2 * size)
+    return (
+        "Player 1:\n"
+        + "".join(f"{card}\n" for card in cards[:size])
+        + "\nPlayer 2:\n"
+        + "".join(f"{card}\n" for card in cards[size:])
+    )
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(f"{seed}-{day}"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Writes synthetic inputs to <output>/inputs/day_N.txt."
+    )
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--days", type=int, nargs="*", default=sorted(GENERATORS))
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1,
+        help="Multiplies each day's default size, which is roughly the size of our real input.",
+    )
+    parser.add_argument("--size", type=int, help="Use this size for every day instead.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(args.output, "inputs"), exist_ok=True)
+    for day in args.days:
+        size = args.size or max(1, round(DEFAULT_SIZES[day] * args.scale))
+        with open(os.path.join(args.output, "inputs", f"day_{day}.txt"), "w") as f:
+            f.write(generate_input(day, size, args.seed))
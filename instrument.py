@@ -0,0 +1,350 @@
+"""Reports how much of each part's time goes to parsing its input, and how much to solving.
+
+Nothing in the solvers needs to change for this: each module's loader functions (the ones named
+load_* or parse_*) are swapped out for timed wrappers while its parts run, so calls made from
+inside the parts are timed too.
+
+    python instrument.py 11 20 --profile-dir profiles
+
+writes profiles/day_11.part_1.prof etc., which can be opened with snakeviz or pstats. Inputs are
+parsed from scratch rather than loaded from the parsed-input cache, so that parse times are real
+ones; pass --input-cache to time cached loads instead.
+
+With --memory, parts are instead run under tracemalloc, and their peak memory use and largest
+allocation sites are reported; --memory-log appends the same information to a JSON-lines file, so
+that it can be tracked over time.
+"""
+
+import argparse
+import cProfile
+import contextlib
+import dataclasses
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Iterator, TypeVar
+
+from bench import PART_NAMES, discover_days, import_day
+from disk_cache import DISABLE_INPUT_CACHE_ENV_VAR
+
+LOADER_PREFIXES = ("load_", "parse_")
+
+T = TypeVar("T")
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+def find_loaders(module: ModuleType) -> list[str]:
+    return [
+        name
+        for name, value in vars(module).items()
+        if name.startswith(LOADER_PREFIXES)
+        and inspect.isfunction(value)
+        and value.__module__ == module.__name__
+    ]
+
+
+@dataclass
+class Nesting:
+    depth: int = 0
+
+
+def timed(fn: Callable, stats: CallStats, nesting: Nesting | None = None) -> Callable:
+    """If `nesting` is given, calls made while another function sharing the same `nesting` is
+    running aren't counted, since their time is already part of that function's."""
+
+    def run(step: Callable[[], T], count_call: bool) -> T:
+        if nesting is not None and nesting.depth:
+            return step()
+
+        start = time.perf_counter()
+        if nesting is not None:
+            nesting.depth += 1
+        try:
+            return step()
+        finally:
+            if nesting is not None:
+                nesting.depth -= 1
+            stats.calls += count_call
+            stats.seconds += time.perf_counter() - start
+
+    if inspect.isgeneratorfunction(fn):
+        # Generators (like day_4's parse_passports) do their work as they're iterated over rather
+        # than when they're called, so each step is timed instead.
+        @functools.wraps(fn)
+        def generator_wrapper(*args, **kwargs):
+            generator = run(functools.partial(fn, *args, **kwargs), count_call=True)
+            while True:
+                try:
+                    item = run(generator.__next__, count_call=False)
+                except StopIteration:
+                    return
+                yield item
+
+        return generator_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return run(functools.partial(fn, *args, **kwargs), count_call=True)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def instrumented(
+    module: ModuleType, function_names: list[str], count_nested_calls: bool = True
+) -> Iterator[dict[str, CallStats]]:
+    """Replaces each of `module`'s `function_names` with a timed version for the duration of the
+    `with` block, and yields a dict of {function name: CallStats}.
+
+    With count_nested_calls=False, calls to one of `function_names` from inside another aren't
+    counted, e.g. day_2's load_input calling parse_password_database.
+    """
+    originals = {name: getattr(module, name) for name in function_names}
+    stats = {name: CallStats() for name in function_names}
+    nesting = None if count_nested_calls else Nesting()
+
+    for name, fn in originals.items():
+        setattr(module, name, timed(fn, stats[name], nesting))
+
+    try:
+        yield stats
+    finally:
+        for name, fn in originals.items():
+            setattr(module, name, fn)
+
+
+@dataclass
+class PhaseReport:
+    name: str
+    total_seconds: float
+    loader_stats: dict[str, CallStats]
+    part_calls: dict[str, int]
+
+    @property
+    def parse_seconds(self) -> float:
+        return sum(stats.seconds for stats in self.loader_stats.values())
+
+    @property
+    def solve_seconds(self) -> float:
+        return self.total_seconds - self.parse_seconds
+
+
+def run_instrumented_part(
+    module: ModuleType, part_name: str, profile_dir: str | None = None
+) -> PhaseReport:
+    part_fn = getattr(module, part_name)
+    loaders = find_loaders(module)
+
+    # Parts are instrumented too, so that we can see when one part calls another (day_9's part_2
+    # calls part_1, for instance). Loaders calling other loaders (day_2's load_input calls
+    # parse_password_database) would have that time counted twice, so those calls are skipped.
+    with instrumented(
+        module, loaders, count_nested_calls=False
+    ) as loader_stats, instrumented(module, list(PART_NAMES)) as part_stats:
+        start = time.perf_counter()
+        if profile_dir:
+            profile = cProfile.Profile()
+            profile.runcall(part_fn)
+        else:
+            part_fn()
+        total_seconds = time.perf_counter() - start
+
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        profile.dump_stats(
+            os.path.join(profile_dir, f"{module.__name__}.{part_name}.prof")
+        )
+
+    return PhaseReport(
+        name=f"{module.__name__}.{part_name}",
+        total_seconds=total_seconds,
+        loader_stats=loader_stats,
+        part_calls={name: stats.calls for name, stats in part_stats.items()},
+    )
+
+
+def print_report(report: PhaseReport) -> None:
+    print(
+        f"{report.name:<16} total {report.total_seconds:9.4f}s "
+        f"parse {report.parse_seconds:9.4f}s solve {report.solve_seconds:9.4f}s"
+    )
+    for name, stats in report.loader_stats.items():
+        if stats.calls:
+            print(f"    {name:<28} {stats.calls:4} call(s) {stats.seconds:9.4f}s")
+    for name, calls in report.part_calls.items():
+        if calls:
+            print(f"    {name:<28} {calls:4} call(s) from inside the part")
+
+
+@dataclass
+class AllocationSite:
+    filename: str
+    lineno: int
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    name: str
+    peak_bytes: int
+    # How much memory was in use when `top_sites` were sampled, which is as close to the peak as
+    # the sampling managed to get.
+    sampled_bytes: int
+    top_sites: list[AllocationSite]
+
+
+def run_part_tracing_memory(
+    module: ModuleType,
+    part_name: str,
+    num_sites: int = 10,
+    sample_interval: float = 0.01,
+) -> MemoryReport:
+    """Runs a part under tracemalloc, and reports its peak memory use and its largest allocation
+    sites at (roughly) that peak.
+
+    Most of what a part allocates is freed by the time it returns, so allocation sites are
+    sampled from a background thread while the part runs, whenever traced memory has grown by 10%
+    since the last sample. One last sample is taken just as the part returns, while its local
+    variables are still alive, which covers parts that finish before the first sample.
+    """
+    part_fn = getattr(module, part_name)
+    largest_snapshot = None
+    largest_snapshot_bytes = 0
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def maybe_take_snapshot() -> None:
+        nonlocal largest_snapshot, largest_snapshot_bytes
+        with lock:
+            current_bytes, _ = tracemalloc.get_traced_memory()
+            if current_bytes > largest_snapshot_bytes * 1.1:
+                largest_snapshot = tracemalloc.take_snapshot()
+                largest_snapshot_bytes = current_bytes
+
+    def sample() -> None:
+        while not done.wait(sample_interval):
+            maybe_take_snapshot()
+
+    def on_return(frame, event, _) -> None:
+        if event == "return" and frame.f_code is part_fn.__code__:
+            maybe_take_snapshot()
+
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    sys.setprofile(on_return)
+    try:
+        part_fn()
+    finally:
+        sys.setprofile(None)
+        done.set()
+        sampler.join()
+
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    statistics = largest_snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    ).statistics("lineno")
+
+    return MemoryReport(
+        name=f"{module.__name__}.{part_name}",
+        peak_bytes=peak_bytes,
+        sampled_bytes=largest_snapshot_bytes,
+        top_sites=[
+            AllocationSite(
+                filename=statistic.traceback[0].filename,
+                lineno=statistic.traceback[0].lineno,
+                size_bytes=statistic.size,
+                count=statistic.count,
+            )
+            for statistic in statistics[:num_sites]
+        ],
+    )
+
+
+def print_memory_report(report: MemoryReport) -> None:
+    print(
+        f"{report.name:<16} peak {report.peak_bytes / 2**20:9.2f} MiB "
+        f"(sites sampled at {report.sampled_bytes / 2**20:.2f} MiB)"
+    )
+    for site in report.top_sites:
+        location = f"{os.path.relpath(site.filename)}:{site.lineno}"
+        print(
+            f"    {location:<40} {site.size_bytes / 2**20:9.2f} MiB "
+            f"in {site.count} blocks"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", type=int, nargs="*", help="Defaults to every day.")
+    parser.add_argument("--parts", type=int, nargs="*", default=[1, 2])
+    parser.add_argument(
+        "--profile-dir",
+        help="Also write a cProfile .prof file per part to this directory.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report peak memory and the largest allocation sites instead of timings.",
+    )
+    parser.add_argument("--memory-sites", type=int, default=10)
+    parser.add_argument(
+        "--memory-log",
+        help="With --memory, also append each part's report to this JSON-lines file.",
+    )
+    parser.add_argument(
+        "--input-cache",
+        action="store_true",
+        help="Load inputs from the parsed-input cache when they're in it, instead of parsing them.",
+    )
+    args = parser.parse_args()
+
+    if not args.input_cache:
+        os.environ[DISABLE_INPUT_CACHE_ENV_VAR] = "1"
+
+    for day in args.days or discover_days():
+        module = import_day(day)
+        for part in args.parts:
+            part_name = f"part_{part}"
+            if not hasattr(module, part_name):
+                continue
+
+            if not args.memory:
+                print_report(run_instrumented_part(module, part_name, args.profile_dir))
+                continue
+
+            memory_report = run_part_tracing_memory(
+                module, part_name, args.memory_sites
+            )
+            print_memory_report(memory_report)
+            if args.memory_log:
+                with open(args.memory_log, "a") as f:
+                    f.write(
+                        json.dumps(
+                            {
+                                "timestamp": time.time(),
+                                **dataclasses.asdict(memory_report),
+                            }
+                        )
+                        + "\n"
+                    )
@@ -0,0 +1,612 @@
+import argparse
+import functools
+import os
+import random
+import re
+import string
+import tempfile
+import time
+import tracemalloc
+from operator import and_
+from typing import Callable, Iterable
+
+from day_1 import find_k_sum
+from day_2 import (
+    count_valid_passwords,
+    count_valid_passwords_sharded,
+    is_password_valid_part_1,
+    is_password_valid_part_2,
+    parse_password_database,
+)
+from day_3 import TreeMap, count_trees_on_slopes
+from day_4 import (
+    PASSPORT_SCHEMA,
+    PASSPORT_VALIDATOR,
+    REQUIRED_PASSPORT_FIELDS,
+    PassportValidator,
+    RejectionStats,
+    count_valid_passports_in_file,
+    order_fields_by_rejection_rate,
+)
+from day_5 import SeatMap, decode_seat_ids, parse_boarding_pass
+from day_6 import answers_to_mask
+from generate_inputs import generate_input
+from seat_index import SeatIndex
+from util import iter_line_groups_from_file, load_line_groups_from_file
+
+
+def measure(fn: Callable[[], object]) -> tuple[float, int]:
+    """Returns (seconds taken, peak traced memory in bytes) for `fn`.
+
+    tracemalloc slows everything down a lot, so `fn` is called twice: once for timing, and once
+    more with tracemalloc enabled to find its peak memory use.
+    """
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def print_result(name: str, elapsed: float, peak: int, num_bytes: int) -> None:
+    print(
+        f"{name:<40} {elapsed:8.3f}s {num_bytes / elapsed / 2**20:10.1f} MiB/s "
+        f"{peak / 2**20:10.1f} MiB peak"
+    )
+
+
+def write_synthetic_line_groups(filename: str, num_groups: int, seed: int = 0) -> None:
+    # Groups look like the day 6 input: a few lines of lowercase letters, separated by empty lines.
+    rng = random.Random(seed)
+    with open(filename, "w") as f:
+        for _ in range(num_groups):
+            for _ in range(rng.randint(1, 5)):
+                f.write("".join(rng.sample(string.ascii_lowercase, rng.randint(1, 26))))
+                f.write("\n")
+            f.write("\n")
+
+
+def consume(groups: Iterable[list]) -> int:
+    return sum(len(group) for group in groups)
+
+
+def bench_line_groups(size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "groups.txt")
+        write_synthetic_line_groups(filename, size)
+        num_bytes = os.path.getsize(filename)
+        print(f"{size} groups, {num_bytes / 2**20:.1f} MiB")
+
+        for name, fn in [
+            (
+                "load_line_groups_from_file",
+                lambda: consume(load_line_groups_from_file(filename)),
+            ),
+            (
+                "iter_line_groups_from_file",
+                lambda: consume(iter_line_groups_from_file(filename)),
+            ),
+            (
+                "iter_line_groups_from_file(as_bytes)",
+                lambda: consume(iter_line_groups_from_file(filename, as_bytes=True)),
+            ),
+        ]:
+            print_result(name, *measure(fn), num_bytes)
+
+
+def nested_loop_pair(numbers: list[int], target: int) -> tuple[int, int] | None:
+    # The original day_1 part_1 search.
+    for i, num_1 in enumerate(numbers):
+        for num_2 in numbers[i + 1 :]:
+            if num_1 + num_2 == target:
+                return num_1, num_2
+
+    return None
+
+
+def nested_loop_triple(numbers: list[int], target: int) -> tuple[int, int, int] | None:
+    # The original day_1 part_2 search.
+    for i, num_1 in enumerate(numbers):
+        for j, num_2 in enumerate(numbers[i + 1 :]):
+            for num_3 in numbers[j + 1 :]:
+                if num_1 + num_2 + num_3 == target:
+                    return num_1, num_2, num_3
+
+    return None
+
+
+def bench_k_sum(size: int) -> None:
+    # Every entry is even and the target is odd, so no search ever finds a match; that's the worst
+    # case for all of them.
+    rng = random.Random(0)
+    target = 10**9 + 1
+
+    for n in sorted({max(10, size // 1000), max(10, size // 100), size // 10, size}):
+        numbers = [2 * rng.randint(1, 10**9 // 2) for _ in range(n)]
+        print(f"{n} numbers")
+
+        searches = [
+            ("find_k_sum(k=2)", lambda: find_k_sum(numbers, 2, target), n),
+            ("find_k_sum(k=3)", lambda: find_k_sum(numbers, 3, target), n**2),
+            ("nested_loop_pair", lambda: nested_loop_pair(numbers, target), n**2),
+            ("nested_loop_triple", lambda: nested_loop_triple(numbers, target), n**3),
+        ]
+        for name, fn, work in searches:
+            # Skip anything that would take more than a minute or so, with tracemalloc running.
+            if work > 10**8:
+                print(f"    {name:<36} skipped")
+                continue
+
+            elapsed, peak = measure(fn)
+            print(f"    {name:<36} {elapsed:10.4f}s {peak / 2**20:10.1f} MiB peak")
+
+
+def bench_expense_index(size: int) -> None:
+    # Imported here so that the other benchmarks don't need numpy.
+    from expense_index import ExpenseIndex
+
+    rng = random.Random(0)
+    numbers = [rng.randint(1, 10 * size) for _ in range(size)]
+    targets = [rng.randint(1, 20 * size) for _ in range(1000)]
+    print(f"{size} numbers, {len(targets)} targets")
+
+    for name, fn in [
+        (
+            "find_k_sum(k=2) per target",
+            lambda: [find_k_sum(numbers, 2, target) for target in targets],
+        ),
+        (
+            "ExpenseIndex.find_pairs",
+            lambda: ExpenseIndex(numbers).find_pairs(targets),
+        ),
+        (
+            "find_k_sum(k=3) per target",
+            lambda: [find_k_sum(numbers, 3, target) for target in targets],
+        ),
+        (
+            "ExpenseIndex.find_triples",
+            lambda: ExpenseIndex(numbers).find_triples(targets),
+        ),
+    ]:
+        elapsed, peak = measure(fn)
+        print(f"    {name:<36} {elapsed:10.4f}s {peak / 2**20:10.1f} MiB peak")
+
+
+def count_valid_passwords_per_line(filename: str) -> tuple[int, int]:
+    # How day_2 used to do it, except that the file is only read once.
+    with open(filename) as f:
+        lines = [line.strip() for line in f]
+
+    return (
+        sum(is_password_valid_part_1(line) for line in lines),
+        sum(is_password_valid_part_2(line) for line in lines),
+    )
+
+
+def count_valid_passwords_in_bulk(filename: str) -> tuple[int, int]:
+    with open(filename, "rb") as f:
+        return count_valid_passwords(parse_password_database(f.read()))
+
+
+def bench_password_database(size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "passwords.txt")
+        with open(filename, "w") as f:
+            f.write(generate_input(2, size))
+        print(f"{size} lines, {os.path.getsize(filename) / 2**20:.1f} MiB")
+
+        assert count_valid_passwords_per_line(filename) == (
+            count_valid_passwords_in_bulk(filename)
+        )
+
+        for name, fn in [
+            ("per line", lambda: count_valid_passwords_per_line(filename)),
+            ("bulk", lambda: count_valid_passwords_in_bulk(filename)),
+        ]:
+            elapsed, peak = measure(fn)
+            print(
+                f"    {name:<36} {elapsed:10.4f}s {size / elapsed:12,.0f} lines/s "
+                f"{peak / 2**20:10.1f} MiB peak"
+            )
+
+
+def bench_password_shards(size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "passwords.txt")
+        with open(filename, "w") as f:
+            f.write(generate_input(2, size))
+        print(f"{size} lines, {os.path.getsize(filename) / 2**20:.1f} MiB")
+
+        start = time.perf_counter()
+        expected = count_valid_passwords_in_bulk(filename)
+        elapsed = time.perf_counter() - start
+        print(f"    {'serial':<36} {elapsed:10.4f}s {size / elapsed:12,.0f} lines/s")
+
+        for jobs in sorted({1, 2, 4, os.cpu_count()}):
+            start = time.perf_counter()
+            counts = count_valid_passwords_sharded(filename, jobs)
+            elapsed = time.perf_counter() - start
+            assert counts == expected
+
+            print(
+                f"    {f'{jobs} job(s)':<36} {elapsed:10.4f}s {size / elapsed:12,.0f} lines/s "
+                f"{size / elapsed / jobs:12,.0f} lines/s per job"
+            )
+
+
+def count_trees_on_slope_in_strings(lines: list[str], slope: tuple[int, int]) -> int:
+    # How day_3 used to count trees, one slope at a time.
+    x, y = 0, 0
+    num_trees_seen = 0
+    while y < len(lines):
+        if lines[y][x] == "#":
+            num_trees_seen += 1
+
+        y += slope[1]
+        x = (x + slope[0]) % len(lines[0])
+
+    return num_trees_seen
+
+
+def bench_tree_slopes(size: int) -> None:
+    # Imported here so that the other benchmarks don't need numpy.
+    from slope_index import SlopeIndex
+
+    lines = generate_input(3, size).split()
+    tree_map = TreeMap.from_lines(lines)
+    rng = random.Random(0)
+
+    for num_slopes in (5, 50):
+        slopes = [(rng.randint(1, 30), rng.randint(1, 3)) for _ in range(num_slopes)]
+        print(f"{size} rows, {num_slopes} slopes")
+
+        for name, fn in [
+            (
+                "per slope, in strings",
+                lambda: [
+                    count_trees_on_slope_in_strings(lines, slope) for slope in slopes
+                ],
+            ),
+            (
+                "count_trees_on_slopes",
+                lambda: count_trees_on_slopes(tree_map, slopes),
+            ),
+            (
+                "SlopeIndex, including building it",
+                lambda: SlopeIndex(tree_map).count_trees_on_slopes(slopes),
+            ),
+        ]:
+            elapsed, peak = measure(fn)
+            print(
+                f"    {name:<36} {elapsed:10.4f}s "
+                f"{size * num_slopes / elapsed:14,.0f} row-slopes/s"
+            )
+
+
+def height_is_valid(passport_value: str) -> bool:
+    if passport_value.endswith("cm"):
+        return 150 <= int(passport_value[:-2]) <= 193
+    elif passport_value.endswith("in"):
+        return 59 <= int(passport_value[:-2]) <= 76
+    else:
+        return False
+
+
+# How day_4 used to validate passports.
+PASSPORT_FIELD_VALIDATORS = {
+    "byr": lambda v: 1920 <= int(v) <= 2002,
+    "iyr": lambda v: 2010 <= int(v) <= 2020,
+    "eyr": lambda v: 2020 <= int(v) <= 2030,
+    "hgt": height_is_valid,
+    "hcl": lambda v: re.match(r"#[0-9a-f]{6,6}", v),
+    "ecl": lambda v: v in {"amb", "blu", "brn", "gry", "grn", "hzl", "oth"},
+    "pid": lambda v: re.match(r"^\d{9,9}$", v),
+    "cid": lambda v: True,
+}
+
+
+def is_passport_valid_with_lambdas(passport: dict[str, str]) -> bool:
+    missing_keys = PASSPORT_FIELD_VALIDATORS.keys() - set(passport.keys())
+    return (not missing_keys or missing_keys == {"cid"}) and all(
+        PASSPORT_FIELD_VALIDATORS[k](v) for (k, v) in passport.items()
+    )
+
+
+def bench_passport_validation(size: int) -> None:
+    passports = [
+        dict(item.split(":") for item in group.split())
+        for group in generate_input(4, size).split("\n\n")
+    ]
+    ordered_validator = PassportValidator(
+        PASSPORT_SCHEMA,
+        REQUIRED_PASSPORT_FIELDS,
+        field_order=order_fields_by_rejection_rate(
+            PASSPORT_SCHEMA, REQUIRED_PASSPORT_FIELDS, passports[:1000]
+        ),
+    )
+    print(f"{size} passports")
+
+    for name, fn in [
+        (
+            "dict of lambdas",
+            lambda: sum(map(is_passport_valid_with_lambdas, passports)),
+        ),
+        ("compiled schema", lambda: PASSPORT_VALIDATOR.count_valid(passports)),
+        (
+            "compiled schema, fail-fast order",
+            lambda: ordered_validator.count_valid(passports),
+        ),
+    ]:
+        elapsed, peak = measure(fn)
+        print(f"    {name:<36} {elapsed:10.4f}s {size / elapsed:12,.0f} passports/s")
+
+
+def count_valid_passports_in_list(filename: str) -> int:
+    # How day_4 used to do it: every passport is parsed into a list before any are checked.
+    passports = [
+        dict(item.split(":") for line in group for item in line.split(" "))
+        for group in load_line_groups_from_file(filename)
+    ]
+    return PASSPORT_VALIDATOR.count_valid(passports)
+
+
+def bench_passport_stream(size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "passports.txt")
+        with open(filename, "w") as f:
+            f.write(generate_input(4, size))
+        print(f"{size} passports, {os.path.getsize(filename) / 2**20:.1f} MiB")
+
+        for name, fn in [
+            ("list", lambda: count_valid_passports_in_list(filename)),
+            ("stream", lambda: count_valid_passports_in_file(filename)),
+            (
+                "stream with rejection stats",
+                lambda: count_valid_passports_in_file(filename, stats=RejectionStats()),
+            ),
+        ]:
+            elapsed, peak = measure(fn)
+            print(
+                f"    {name:<36} {elapsed:10.4f}s {size / elapsed:12,.0f} passports/s "
+                f"{peak / 2**20:10.1f} MiB peak"
+            )
+
+
+def parse_boarding_pass_by_halving(
+    boarding_pass: str, num_rows: int, num_columns: int
+) -> int:
+    # How day_5 used to decode boarding passes, for any size of plane.
+    num_row_chars = (num_rows - 1).bit_length()
+    row_range = [0, num_rows - 1]
+    for char in boarding_pass[:num_row_chars]:
+        half_row_range_difference = (row_range[1] - row_range[0]) // 2 + 1
+        if char == "F":
+            row_range[1] -= half_row_range_difference
+        else:
+            row_range[0] += half_row_range_difference
+
+    col_range = [0, num_columns - 1]
+    for char in boarding_pass[num_row_chars:]:
+        half_col_range_difference = (col_range[1] - col_range[0]) // 2 + 1
+        if char == "L":
+            col_range[1] -= half_col_range_difference
+        else:
+            col_range[0] += half_col_range_difference
+
+    return row_range[0] * num_columns + col_range[0]
+
+
+def find_seat_by_sorting(seat_ids: list[int]) -> int:
+    # How day_5 used to find your seat.
+    seats = sorted(seat_ids)
+    for i, seat in enumerate(seats):
+        if seats[i + 1] - seat > 1:
+            return seat + 1
+
+
+def bench_seat_map(size: int) -> None:
+    # A plane with about `size` seats, all of them taken apart from yours.
+    num_columns = 8
+    num_rows = max(2, 1 << (size // num_columns - 1).bit_length())
+    num_row_chars = (num_rows - 1).bit_length()
+    num_seats = num_rows * num_columns
+    rng = random.Random(0)
+    seat_ids = list(range(num_seats))
+    del seat_ids[rng.randrange(1, num_seats - 1)]
+    rng.shuffle(seat_ids)
+
+    table = str.maketrans("01", "FB")
+    data = "".join(
+        format(seat_id >> 3, f"0{num_row_chars}b").translate(table)
+        + format(seat_id & 7, "03b").replace("0", "L").replace("1", "R")
+        + "\n"
+        for seat_id in seat_ids
+    ).encode()
+    lines = data.decode().split()
+    print(f"{num_rows} rows of {num_columns} seats")
+
+    def by_halving() -> tuple[int, int]:
+        ids = [
+            parse_boarding_pass_by_halving(line, num_rows, num_columns)
+            for line in lines
+        ]
+        return max(ids), find_seat_by_sorting(ids)
+
+    def with_seat_map() -> tuple[int, int]:
+        seat_map = SeatMap(decode_seat_ids(data), num_rows, num_columns)
+        return (
+            seat_map.highest_taken_seat(),
+            seat_map.free_seats_between_taken_seats()[0],
+        )
+
+    assert by_halving() == with_seat_map()
+
+    for name, fn in [
+        ("halving, then sorting", by_halving),
+        ("decode_seat_ids + SeatMap", with_seat_map),
+    ]:
+        elapsed, peak = measure(fn)
+        print(
+            f"    {name:<36} {elapsed:10.4f}s {len(lines) / elapsed:12,.0f} passes/s "
+            f"{peak / 2**20:10.1f} MiB peak"
+        )
+
+
+def scan_into_bytearray(
+    boarding_passes: list[str], num_seats: int, query_every: int
+) -> list:
+    # The simplest live alternative to a SeatIndex: one byte per seat, with every query done by
+    # searching the whole thing.
+    taken = bytearray(num_seats)
+    answers = []
+    for i, boarding_pass in enumerate(boarding_passes, 1):
+        taken[parse_boarding_pass(boarding_pass)] = 1
+        if i % query_every == 0:
+            first_free = taken.find(0, 10 * 8, 41 * 8)
+            length = max(map(len, taken.split(b"\x01")))
+            answers.append(
+                (
+                    None if first_free == -1 else first_free,
+                    (taken.find(bytes(length)), length) if length else None,
+                )
+            )
+    return answers
+
+
+def scan_into_seat_index(
+    boarding_passes: list[str], num_rows: int, query_every: int
+) -> list:
+    index = SeatIndex(num_rows, 8)
+    answers = []
+    for i, boarding_pass in enumerate(boarding_passes, 1):
+        index.scan(boarding_pass)
+        if i % query_every == 0:
+            answers.append(
+                (index.first_free_seat_in_rows(10, 40), index.longest_free_run())
+            )
+    return answers
+
+
+def bench_seat_index(size: int) -> None:
+    # Scan `size` boarding passes, in a random order, onto a plane with at least that many seats.
+    num_rows = max(64, 1 << (size // 8 - 1).bit_length())
+    num_row_chars = (num_rows - 1).bit_length()
+    table = str.maketrans("01", "FB")
+    seat_ids = random.Random(0).sample(range(num_rows * 8), size)
+    boarding_passes = [
+        format(seat_id >> 3, f"0{num_row_chars}b").translate(table)
+        + format(seat_id & 7, "03b").replace("0", "L").replace("1", "R")
+        for seat_id in seat_ids
+    ]
+    print(f"{size} scans onto {num_rows} rows of 8 seats")
+
+    query_every = max(1, size // 1000)
+    assert scan_into_bytearray(
+        boarding_passes, num_rows * 8, query_every
+    ) == scan_into_seat_index(boarding_passes, num_rows, query_every)
+
+    for name, fn in [
+        (
+            f"bytearray, query every {query_every}",
+            lambda: scan_into_bytearray(boarding_passes, num_rows * 8, query_every),
+        ),
+        (
+            f"SeatIndex, query every {query_every}",
+            lambda: scan_into_seat_index(boarding_passes, num_rows, query_every),
+        ),
+        (
+            "SeatIndex, query every scan",
+            lambda: scan_into_seat_index(boarding_passes, num_rows, 1),
+        ),
+    ]:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"    {name:<36} {elapsed:10.4f}s {size / elapsed:12,.0f} scans/s")
+
+
+def count_answers_with_sets(groups: list[list[str]]) -> tuple[int, int]:
+    # How day_6 used to count answers, with a set per line.
+    anyone = [
+        functools.reduce(lambda x, y: x | set(y), group_answers, set())
+        for group_answers in groups
+    ]
+    everyone = [
+        functools.reduce(
+            lambda x, y: x & set(y), group_answers, set(string.ascii_lowercase)
+        )
+        for group_answers in groups
+    ]
+    return sum(map(len, anyone)), sum(map(len, everyone))
+
+
+def count_answers_with_masks(groups: list[list[str]]) -> tuple[int, int]:
+    num_anyone = 0
+    num_everyone = 0
+    for group_answers in groups:
+        num_anyone += answers_to_mask("".join(group_answers)).bit_count()
+        num_everyone += functools.reduce(
+            and_, map(answers_to_mask, group_answers)
+        ).bit_count()
+    return num_anyone, num_everyone
+
+
+def bench_answer_masks(size: int) -> None:
+    # Imported here so that the other benchmarks don't need numpy.
+    import numpy as np
+    from answer_counts import build_answer_counts
+
+    groups = [group.split() for group in generate_input(6, size).split("\n\n")]
+    print(f"{size} groups, {sum(map(len, groups))} lines")
+
+    def count_answers_with_matrix() -> tuple[int, int]:
+        answer_counts = build_answer_counts(groups)
+        return (
+            np.count_nonzero(answer_counts.answered_by_anyone()),
+            np.count_nonzero(answer_counts.answered_by_everyone()),
+        )
+
+    answer_counts = build_answer_counts(groups)
+    assert count_answers_with_sets(groups) == count_answers_with_masks(groups)
+    assert count_answers_with_masks(groups) == count_answers_with_matrix()
+
+    for name, fn in [
+        ("sets", lambda: count_answers_with_sets(groups)),
+        ("masks", lambda: count_answers_with_masks(groups)),
+        ("AnswerCounts, including building it", count_answers_with_matrix),
+        (
+            "AnswerCounts, at least half, built",
+            lambda: np.count_nonzero(answer_counts.answered_by_at_least_fraction(0.5)),
+        ),
+    ]:
+        elapsed, peak = measure(fn)
+        print(f"    {name:<36} {elapsed:10.4f}s {size / elapsed:12,.0f} groups/s")
+
+
+BENCHMARKS = {
+    "line_groups": bench_line_groups,
+    "k_sum": bench_k_sum,
+    "expense_index": bench_expense_index,
+    "password_database": bench_password_database,
+    "password_shards": bench_password_shards,
+    "tree_slopes": bench_tree_slopes,
+    "passport_validation": bench_passport_validation,
+    "passport_stream": bench_passport_stream,
+    "seat_map": bench_seat_map,
+    "seat_index": bench_seat_index,
+    "answer_masks": bench_answer_masks,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmark", choices=BENCHMARKS.keys())
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    BENCHMARKS[args.benchmark](args.size)
@@ -0,0 +1,114 @@
+"""Runs every day's parts concurrently in a process pool.
+
+A full sequential run is dominated by a handful of slow parts, so parts are submitted slowest
+first, going by the median times recorded in a previous bench.py run; that way the slowest part
+starts right away, and the quick ones fill in the gaps around it. Parts without a recorded time
+are assumed to be slow.
+
+Answers are cached the same way as `python -m advent run`'s, so pass --no-cache when you want to
+see how long the parts actually take.
+
+    python parallel.py --jobs 8
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import time
+
+from bench import PART_NAMES, REPO_DIRECTORY, discover_days, import_day
+from disk_cache import DISABLE_ANSWER_CACHE_ENV_VAR, cached_answer
+
+
+def run_part(day: int, part_name: str) -> tuple[str, float]:
+    """Returns (answer, seconds taken)."""
+    module = import_day(day)
+    part_fn = getattr(module, part_name)
+
+    start = time.perf_counter()
+    answer = cached_answer(module, part_name, part_fn)
+    return str(answer), time.perf_counter() - start
+
+
+def load_expected_seconds(timings_filename: str) -> dict[str, float]:
+    try:
+        with open(timings_filename) as f:
+            results = json.load(f)["results"]
+    except FileNotFoundError:
+        return {}
+
+    return {name: result["wall"]["median"] for name, result in results.items()}
+
+
+def schedule(part_names: list[str], expected_seconds: dict[str, float]) -> list[str]:
+    return sorted(
+        part_names,
+        key=lambda name: expected_seconds.get(name, float("inf")),
+        reverse=True,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="*", help="Only run these days.")
+    parser.add_argument(
+        "--skip", nargs="*", default=[], help="Parts to skip, like day_15.part_2."
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--timings",
+        default=str(REPO_DIRECTORY / "bench_output.txt"),
+        help="A bench.py output file to take expected times from.",
+    )
+    parser.add_argument("--output", help="Also write the report to this file as JSON.")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Don't use cached answers."
+    )
+    args = parser.parse_args()
+
+    if args.no_cache:
+        # Set before the pool starts, so that its worker processes inherit it.
+        os.environ[DISABLE_ANSWER_CACHE_ENV_VAR] = "1"
+
+    parts = {
+        f"day_{day}.{part_name}": (day, part_name)
+        for day in args.days or discover_days()
+        for part_name in PART_NAMES
+        if f"day_{day}.{part_name}" not in args.skip
+    }
+    part_names = schedule(list(parts), load_expected_seconds(args.timings))
+
+    start = time.perf_counter()
+    report = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(run_part, *parts[name]): name for name in part_names}
+
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                answer, seconds = future.result()
+            except Exception as e:
+                report[name] = {"error": repr(e)}
+                print(f"{name:<16} failed: {e!r}", flush=True)
+                continue
+
+            report[name] = {"answer": answer, "seconds": seconds}
+            print(f"{name:<16} {seconds:9.4f}s  {answer}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    total_seconds = sum(result.get("seconds", 0) for result in report.values())
+    print(
+        f"{len(report)} parts in {elapsed:.2f}s with {args.jobs} jobs "
+        f"({total_seconds:.2f}s if run one after another)"
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"jobs": args.jobs, "elapsed": elapsed, "results": report}, f, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
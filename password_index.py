@@ -0,0 +1,166 @@
+"""An index of a day 2 password file, for checking the same passwords against many new policies.
+
+Building the index scans every password once, recording how many times each character appears
+in it and which character is at each position. After that, count-based policies like part 1's
+and position-based policies like part 2's can be checked for every password at once, with numpy,
+without looking at the password text again. Indexes can be saved to a .npz file and loaded in a
+later run:
+
+    python password_index.py build passwords.txt passwords.npz
+    python password_index.py check passwords.npz
+
+numpy isn't needed by anything else in day 2, which is why this lives outside of day_2.py.
+"""
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+from day_2 import PasswordDatabase, parse_password_database
+
+
+@dataclass
+class PasswordIndex:
+    # Each password's policy, as it appears in the password file.
+    lows: np.ndarray
+    highs: np.ndarray
+    chars: np.ndarray
+    # The characters that appear in any password or policy. histograms[i, c] is how many times
+    # alphabet[c] appears in password i; the last column is all zeroes, for characters that aren't
+    # in the alphabet.
+    alphabet: np.ndarray
+    histograms: np.ndarray
+    # Every password's char codes, in order, with a 0 between each password and the next (and at
+    # either end), so that password i's character at 1-based position p is
+    # passwords[separators[i] + p]. Positions 0 and len + 1 are always 0.
+    passwords: np.ndarray
+    separators: np.ndarray
+    lengths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    def columns_of(self, chars: np.ndarray) -> np.ndarray:
+        positions = np.clip(
+            np.searchsorted(self.alphabet, chars), 0, len(self.alphabet)
+        )
+        in_alphabet = (positions < len(self.alphabet)) & (
+            self.alphabet[np.minimum(positions, len(self.alphabet) - 1)] == chars
+        )
+        return np.where(in_alphabet, positions, len(self.alphabet))
+
+    def counts_of(self, chars: np.ndarray) -> np.ndarray:
+        """Returns how many times chars[i] appears in password i, for every password."""
+        return self.histograms[np.arange(len(self)), self.columns_of(chars)]
+
+    def chars_at(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the char code at 1-based position positions[i] in password i, for every
+        password, with 0 wherever a password is too short to have that position."""
+        return self.passwords[self.separators + np.clip(positions, 0, self.lengths + 1)]
+
+    def save(self, filename: str) -> None:
+        np.savez(filename, **vars(self))
+
+    @staticmethod
+    def load(filename: str) -> "PasswordIndex":
+        with np.load(filename) as arrays:
+            return PasswordIndex(**arrays)
+
+
+def build_password_index(database: PasswordDatabase) -> PasswordIndex:
+    data = np.frombuffer(database.data, dtype=np.uint8)
+    starts = np.asarray(database.password_starts, dtype=np.int64)
+    ends = np.asarray(database.password_ends, dtype=np.int64)
+    lengths = ends - starts
+    chars = np.frombuffer(bytes(database.chars), dtype=np.uint8)
+
+    # Gather every password's bytes out of the file, in order, along with which password each
+    # byte belongs to.
+    owners = np.repeat(np.arange(len(lengths)), lengths)
+    offsets_within_passwords = np.arange(len(owners)) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    codes = data[np.repeat(starts, lengths) + offsets_within_passwords]
+
+    alphabet = np.union1d(np.unique(codes), chars).astype(np.uint8)
+    width = len(alphabet) + 1
+    columns = np.searchsorted(alphabet, codes)
+    histograms = np.bincount(
+        owners * width + columns, minlength=len(lengths) * width
+    ).reshape(len(lengths), width)
+    # A count can't be any bigger than its password is long.
+    histogram_dtype = np.uint8 if lengths.max(initial=0) < 256 else np.uint32
+
+    # Leave a gap for a 0 before each password, and one after the last; that shifts each
+    # password's bytes along by one more than the number of passwords before it.
+    separators = np.concatenate(([0], np.cumsum(lengths + 1)))
+    passwords = np.zeros(separators[-1] + 1, dtype=np.uint8)
+    passwords[np.arange(len(codes)) + owners + 1] = codes
+
+    return PasswordIndex(
+        lows=np.asarray(database.lows, dtype=np.uint32),
+        highs=np.asarray(database.highs, dtype=np.uint32),
+        chars=chars,
+        alphabet=alphabet,
+        histograms=histograms.astype(histogram_dtype),
+        passwords=passwords,
+        separators=separators[:-1],
+        lengths=lengths.astype(np.uint32),
+    )
+
+
+def count_valid_by_count(
+    index: PasswordIndex,
+    lows: np.ndarray | None = None,
+    highs: np.ndarray | None = None,
+    chars: np.ndarray | None = None,
+) -> int:
+    """Returns how many passwords contain chars[i] between lows[i] and highs[i] times, like part
+    1's policy. Each of the policy's columns defaults to the one from the password file.
+    """
+    lows = index.lows if lows is None else lows
+    highs = index.highs if highs is None else highs
+    counts = index.counts_of(index.chars if chars is None else chars)
+
+    return int(np.count_nonzero((lows <= counts) & (counts <= highs)))
+
+
+def count_valid_by_position(
+    index: PasswordIndex,
+    positions_1: np.ndarray | None = None,
+    positions_2: np.ndarray | None = None,
+    chars: np.ndarray | None = None,
+) -> int:
+    """Returns how many passwords contain chars[i] at exactly one of positions_1[i] and
+    positions_2[i], like part 2's policy. Each of the policy's columns defaults to the one from
+    the password file."""
+    positions_1 = index.lows if positions_1 is None else positions_1
+    positions_2 = index.highs if positions_2 is None else positions_2
+    chars = index.chars if chars is None else chars
+
+    return int(
+        np.count_nonzero(
+            (index.chars_at(positions_1) == chars)
+            != (index.chars_at(positions_2) == chars)
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build")
+    build_parser.add_argument("passwords")
+    build_parser.add_argument("index")
+    check_parser = subparsers.add_parser("check")
+    check_parser.add_argument("index")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.passwords, "rb") as f:
+            build_password_index(parse_password_database(f.read())).save(args.index)
+    else:
+        index = PasswordIndex.load(args.index)
+        print(count_valid_by_count(index))
+        print(count_valid_by_position(index))
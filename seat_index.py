@@ -0,0 +1,270 @@
+"""Keeps track of which day 5 seats are free while boarding passes are still being scanned.
+
+Seats live in a segment tree over seat IDs. Each node covers a power-of-two-sized block of seats
+and knows the longest run of free seats in its block, along with the runs of free seats at
+either end of its block. Taking or freeing a seat only changes the nodes above it, and finding
+the first free seat in a range or the longest run of free seats only follows one or two paths
+down the tree, so everything's O(log n) in the number of seats on the plane.
+
+    python seat_index.py --rows 10 40
+"""
+
+import argparse
+import random
+from typing import Iterable, Iterator
+
+from day_5 import NUM_COLUMNS_ON_PLANE, NUM_ROWS_ON_PLANE, parse_boarding_pass
+
+
+class SeatIndex:
+    def __init__(
+        self,
+        num_rows: int = NUM_ROWS_ON_PLANE,
+        num_columns: int = NUM_COLUMNS_ON_PLANE,
+        taken_seat_ids: Iterable[int] = (),
+    ):
+        self.num_columns = num_columns
+        self.num_seats = num_rows * num_columns
+        # The number of leaves; the plane's dimensions are powers of two, but pad just in case.
+        self.size = 1 << (self.num_seats - 1).bit_length()
+
+        # Node 1 is the root, node n's children are 2n and 2n + 1, and seat i is leaf size + i.
+        # Leaves for seats past the end of the plane count as taken.
+        leaves = [1] * self.num_seats + [0] * (self.size - self.num_seats)
+        for seat_id in taken_seat_ids:
+            leaves[self._check_seat_id(seat_id)] = 0
+
+        self.longest = [0] * self.size + leaves
+        self.prefix = [0] * self.size + leaves
+        self.suffix = [0] * self.size + leaves
+        self.num_free = sum(leaves)
+
+        # Fill in the rest of the tree a level at a time, from the bottom up.
+        level_start = self.size // 2
+        half = 1
+        while level_start:
+            for node in range(level_start, level_start * 2):
+                self._combine(node, half)
+            level_start //= 2
+            half *= 2
+
+    def _check_seat_id(self, seat_id: int) -> int:
+        if not 0 <= seat_id < self.num_seats:
+            raise ValueError(f"no seat with ID {seat_id} on this plane")
+        return seat_id
+
+    def _combine(self, node: int, half: int) -> bool:
+        """Recomputes `node` from its children, which each cover `half` seats, and returns whether
+        anything about it changed."""
+        longest, prefix, suffix = self.longest, self.prefix, self.suffix
+        left = node * 2
+        right = left + 1
+
+        new_prefix = prefix[left] if prefix[left] < half else half + prefix[right]
+        new_suffix = suffix[right] if suffix[right] < half else half + suffix[left]
+        new_longest = suffix[left] + prefix[right]
+        if longest[left] > new_longest:
+            new_longest = longest[left]
+        if longest[right] > new_longest:
+            new_longest = longest[right]
+
+        if (
+            new_longest == longest[node]
+            and new_prefix == prefix[node]
+            and new_suffix == suffix[node]
+        ):
+            return False
+
+        longest[node] = new_longest
+        prefix[node] = new_prefix
+        suffix[node] = new_suffix
+        return True
+
+    def _set_leaf(self, seat_id: int, free: int) -> None:
+        node = self.size + seat_id
+        self.longest[node] = self.prefix[node] = self.suffix[node] = free
+
+        node //= 2
+        half = 1
+        # Nothing above a node that didn't change can change either.
+        while node and self._combine(node, half):
+            node //= 2
+            half *= 2
+
+    def is_free(self, seat_id: int) -> bool:
+        return bool(self.longest[self.size + self._check_seat_id(seat_id)])
+
+    def take(self, seat_id: int) -> None:
+        if not self.is_free(seat_id):
+            raise ValueError(f"seat {seat_id} is already taken")
+        self._set_leaf(seat_id, 0)
+        self.num_free -= 1
+
+    def release(self, seat_id: int) -> None:
+        if self.is_free(seat_id):
+            raise ValueError(f"seat {seat_id} isn't taken")
+        self._set_leaf(seat_id, 1)
+        self.num_free += 1
+
+    def scan(self, boarding_pass: str) -> int:
+        """Takes the seat on `boarding_pass`, and returns its ID."""
+        seat_id = parse_boarding_pass(boarding_pass)
+        self.take(seat_id)
+        return seat_id
+
+    def first_free_seat(self, start: int = 0, end: int | None = None) -> int | None:
+        """Returns the lowest free seat ID in [start, end), or None if they're all taken."""
+        end = self.num_seats if end is None else min(end, self.num_seats)
+        return self._first_free_seat(1, 0, self.size, max(start, 0), end)
+
+    def _first_free_seat(
+        self, node: int, node_start: int, node_size: int, start: int, end: int
+    ) -> int | None:
+        if (
+            not self.longest[node]
+            or node_start >= end
+            or node_start + node_size <= start
+        ):
+            return None
+
+        if start <= node_start and node_start + node_size <= end:
+            # The whole block is in range, so head straight for its leftmost free seat.
+            while node < self.size:
+                node = node * 2 if self.longest[node * 2] else node * 2 + 1
+            return node - self.size
+
+        half = node_size // 2
+        seat_id = self._first_free_seat(node * 2, node_start, half, start, end)
+        if seat_id is None:
+            seat_id = self._first_free_seat(
+                node * 2 + 1, node_start + half, half, start, end
+            )
+        return seat_id
+
+    def first_free_seat_in_rows(self, first_row: int, last_row: int) -> int | None:
+        """Like first_free_seat, for the seats in rows first_row through last_row inclusive."""
+        return self.first_free_seat(
+            first_row * self.num_columns, (last_row + 1) * self.num_columns
+        )
+
+    def free_seats(self) -> Iterator[int]:
+        seat_id = self.first_free_seat()
+        while seat_id is not None:
+            yield seat_id
+            seat_id = self.first_free_seat(seat_id + 1)
+
+    def longest_free_run(self) -> tuple[int, int] | None:
+        """Returns (first seat ID, length) of the longest run of consecutive free seats, preferring
+        the lowest one in the case of a tie, or None if every seat is taken."""
+        longest, prefix, suffix = self.longest, self.prefix, self.suffix
+        length = longest[1]
+        if not length:
+            return None
+
+        node = 1
+        node_start = 0
+        half = self.size // 2
+        while node < self.size:
+            left = node * 2
+            if longest[left] == length:
+                node = left
+            elif suffix[left] + prefix[left + 1] == length:
+                return node_start + half - suffix[left], length
+            else:
+                node = left + 1
+                node_start += half
+            half //= 2
+
+        return node - self.size, length
+
+
+def brute_force_longest_free_run(free: list[bool]) -> tuple[int, int] | None:
+    best = None
+    run_start = None
+    for seat_id, is_free in enumerate(free + [False]):
+        if is_free and run_start is None:
+            run_start = seat_id
+        elif not is_free and run_start is not None:
+            if best is None or seat_id - run_start > best[1]:
+                best = (run_start, seat_id - run_start)
+            run_start = None
+    return best
+
+
+def test_seat_index_matches_brute_force() -> None:
+    rng = random.Random(0)
+    for num_rows, num_columns in [(1, 1), (2, 4), (8, 8), (16, 8), (3, 5)]:
+        num_seats = num_rows * num_columns
+        taken = rng.sample(range(num_seats), rng.randint(0, num_seats))
+        index = SeatIndex(num_rows, num_columns, taken)
+        free = [seat_id not in taken for seat_id in range(num_seats)]
+
+        for _ in range(200):
+            seat_id = rng.randrange(num_seats)
+            if free[seat_id]:
+                index.take(seat_id)
+            else:
+                index.release(seat_id)
+            free[seat_id] = not free[seat_id]
+
+            start, end = sorted(rng.randrange(num_seats + 1) for _ in range(2))
+            assert index.first_free_seat(start, end) == next(
+                (i for i in range(start, end) if free[i]), None
+            )
+            first_row, last_row = sorted(rng.randrange(num_rows) for _ in range(2))
+            assert index.first_free_seat_in_rows(first_row, last_row) == next(
+                (
+                    i
+                    for i in range(
+                        first_row * num_columns, (last_row + 1) * num_columns
+                    )
+                    if free[i]
+                ),
+                None,
+            )
+            assert index.longest_free_run() == brute_force_longest_free_run(free)
+            assert list(index.free_seats()) == [i for i in range(num_seats) if free[i]]
+            assert index.num_free == sum(free)
+
+
+def test_longest_free_run_prefers_the_lowest_seats() -> None:
+    # Free seats: 0-2, 4-6 and 9-11, which are all three seats long.
+    index = SeatIndex(2, 8, taken_seat_ids=[3, 7, 8, 12, 13, 14, 15])
+    assert index.longest_free_run() == (0, 3)
+    index.take(1)
+    assert index.longest_free_run() == (4, 3)
+    index.take(5)
+    assert index.longest_free_run() == (9, 3)
+
+
+def test_taking_a_taken_seat_raises() -> None:
+    index = SeatIndex(1, 8)
+    index.scan("RLR")
+    try:
+        index.scan("RLR")
+    except ValueError:
+        pass
+    else:
+        assert False, "expected a ValueError"
+
+
+if __name__ == "__main__":
+    test_seat_index_matches_brute_force()
+    test_longest_free_run_prefers_the_lowest_seats()
+    test_taking_a_taken_seat_raises()
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs=2, default=(0, NUM_ROWS_ON_PLANE - 1))
+    args = parser.parse_args()
+
+    index = SeatIndex()
+    with open("inputs/day_5.txt") as f:
+        for line in f:
+            if line.strip():
+                index.scan(line.strip())
+
+    print(f"{index.num_free} free seats")
+    print(f"first free seat in rows {args.rows[0]}-{args.rows[1]}:")
+    print(index.first_free_seat_in_rows(*args.rows))
+    print("longest run of free seats (first seat ID, length):")
+    print(index.longest_free_run())
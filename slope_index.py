@@ -0,0 +1,134 @@
+"""Counts the trees on day 3 slopes without walking down the whole map for each one.
+
+The map repeats to the right, so on slope (dx, dy) the column you're in repeats every
+period = width / gcd(dx, width) steps, i.e. every stride = period * dy rows. Each step j of the
+first period is in the same column as steps j + period, j + 2 * period, ..., and those steps are
+on rows j * dy, j * dy + stride, j * dy + 2 * stride, ... So if we know how many trees each column
+has on each residue class of rows mod stride, we can count the trees on the slope with one lookup
+per step of the first period, however tall the map is.
+
+Those per-residue counts only depend on the stride, so they're worked out once per stride, with
+numpy, and shared between every slope that has that stride.
+
+    python slope_index.py --max-dy 2
+"""
+
+import argparse
+import math
+import random
+from typing import Iterable
+
+import numpy as np
+
+from day_3 import TreeMap, load_map
+
+
+class SlopeIndex:
+    def __init__(self, tree_map: TreeMap):
+        self.width = tree_map.width
+        self.height = len(tree_map.rows)
+
+        # trees[y, x] is 1 if there's a tree at (x, y).
+        row_bytes = (self.width + 7) // 8
+        packed = np.frombuffer(
+            b"".join(row.to_bytes(row_bytes, "little") for row in tree_map.rows),
+            dtype=np.uint8,
+        ).reshape(self.height, row_bytes)
+        self.trees = np.unpackbits(packed, axis=1, bitorder="little")[:, : self.width]
+
+        self.tables_by_stride: dict[int, np.ndarray] = {}
+
+    def residue_table(self, stride: int) -> np.ndarray:
+        """Returns a (stride, width) array of how many trees each column has on the rows whose
+        index is congruent to each residue mod `stride`."""
+        if stride not in self.tables_by_stride:
+            padded_height = -(-self.height // stride) * stride
+            padded = np.zeros((padded_height, self.width), dtype=np.int32)
+            padded[: self.height] = self.trees
+            self.tables_by_stride[stride] = padded.reshape(-1, stride, self.width).sum(
+                axis=0
+            )
+
+        return self.tables_by_stride[stride]
+
+    def count_trees(self, slope: tuple[int, int]) -> int:
+        dx, dy = slope
+        period = self.width // math.gcd(dx, self.width)
+        num_steps = -(-self.height // dy)
+        steps = np.arange(min(period, num_steps))
+        columns = steps * dx % self.width
+
+        # If we reach the bottom before the columns start repeating, each step is on a row of its
+        # own, so there's nothing to gain from the residue table.
+        if num_steps <= period:
+            return int(self.trees[steps * dy, columns].sum())
+
+        return int(self.residue_table(period * dy)[steps * dy, columns].sum())
+
+    def count_trees_on_slopes(self, slopes: Iterable[tuple[int, int]]) -> list[int]:
+        return [self.count_trees(slope) for slope in slopes]
+
+    def candidate_slopes(self, max_dy: int) -> list[tuple[int, int]]:
+        """Every distinct slope going down at most `max_dy` rows per step. Going right by dx and
+        by dx + width visits the same squares, so dx only goes up to the width of the map.
+        """
+        return [(dx, dy) for dy in range(1, max_dy + 1) for dx in range(self.width)]
+
+    def find_slope_with_fewest_trees(
+        self, slopes: Iterable[tuple[int, int]]
+    ) -> tuple[tuple[int, int], int]:
+        """Returns (slope, number of trees on it) for whichever of `slopes` has the fewest trees,
+        preferring the earliest one in the case of a tie."""
+        return min(
+            ((slope, self.count_trees(slope)) for slope in slopes),
+            key=lambda slope_and_count: slope_and_count[1],
+        )
+
+
+def count_trees_by_walking(lines: list[str], slope: tuple[int, int]) -> int:
+    dx, dy = slope
+    return sum(
+        lines[y][y // dy * dx % len(lines[0])] == "#" for y in range(0, len(lines), dy)
+    )
+
+
+def test_count_trees_matches_walking() -> None:
+    rng = random.Random(0)
+    for _ in range(200):
+        width = rng.randint(1, 12)
+        lines = [
+            "".join(rng.choice("#..") for _ in range(width))
+            for _ in range(rng.randint(1, 60))
+        ]
+        index = SlopeIndex(TreeMap.from_lines(lines))
+
+        # Slopes whose columns repeat before the bottom, ones that don't, and ones that go right
+        # by more than the width of the map.
+        slopes = [(rng.randint(0, 3 * width), rng.randint(1, 4)) for _ in range(10)]
+        assert index.count_trees_on_slopes(slopes) == [
+            count_trees_by_walking(lines, slope) for slope in slopes
+        ]
+
+
+def test_find_slope_with_fewest_trees() -> None:
+    lines = ["..#", "#.#", "..#", "#.."]
+    index = SlopeIndex(TreeMap.from_lines(lines))
+    # Every slope that goes down one row at a time hits two trees, so the first one wins the tie,
+    # but going down two rows at a time only visits the two rows with no tree in columns 0 and 1.
+    assert index.find_slope_with_fewest_trees(index.candidate_slopes(1)) == ((0, 1), 2)
+    assert index.find_slope_with_fewest_trees([(1, 1), (3, 1), (1, 2)]) == ((1, 2), 0)
+
+
+if __name__ == "__main__":
+    test_count_trees_matches_walking()
+    test_find_slope_with_fewest_trees()
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-dy", type=int, default=1)
+    args = parser.parse_args()
+
+    index = SlopeIndex(load_map())
+    slope, num_trees = index.find_slope_with_fewest_trees(
+        index.candidate_slopes(args.max_dy)
+    )
+    print(f"right {slope[0]}, down {slope[1]}: {num_trees} trees")
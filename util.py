@@ -1,4 +1,7 @@
 import itertools
+import mmap
+import os
+from typing import Iterator
 
 
 def load_line_groups_from_file(filename: str) -> list[list[str]]:
@@ -36,3 +39,34 @@ def load_line_groups_from_file(filename: str) -> list[list[str]]:
         result.append(list(lines_since_last_empty_line))
 
     return result
+
+
+def iter_line_groups_from_file(
+    filename: str, as_bytes: bool = False
+) -> Iterator[list[str]] | Iterator[list[bytes]]:
+    """A streaming version of `load_line_groups_from_file`, for group files too big to read into memory.
+
+    The file is memory-mapped rather than read, and groups are yielded one at a time, so memory use
+    stays proportional to the largest group rather than to the whole file. Lines are stripped just
+    like in `load_line_groups_from_file`; they're yielded as `bytes` if `as_bytes` is set, and are
+    otherwise decoded one group at a time as the group is yielded.
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            # Reading a line at a time, rather than jumping between blank lines, means that CRLF
+            # files and lines with nothing but whitespace on them still split into groups without
+            # ever copying more than one line out of the buffer.
+            group = []
+            for line in iter(buffer.readline, b""):
+                line = line.strip()
+                if line:
+                    group.append(line)
+                elif group:
+                    yield group if as_bytes else [member.decode() for member in group]
+                    group = []
+
+            if group:
+                yield group if as_bytes else [member.decode() for member in group]